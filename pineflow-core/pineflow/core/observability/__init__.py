@@ -1,11 +1,22 @@
 import warnings
 
-from pineflow.core.observability.base import BaseObservability, ModelObservability
+__all__ = ["BaseObservability", "ModelObservability"]
 
-__all__ = (["BaseObservability", "ModelObservability"],)
 
-warnings.warn(
-    "pineflow.core.observability has moved. Please use 'pineflow.core.monitors' instead.",
-    DeprecationWarning,
-    stacklevel=2,
-)
+def __getattr__(name: str):
+    # Warn on first use instead of on import, and defer loading the module
+    if name in __all__:
+        warnings.warn(
+            "pineflow.core.observability has moved. Please use 'pineflow.core.monitors' instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        from pineflow.core.observability import base
+
+        # Bind every exported name at once, later lookups skip the warning
+        globals().update({export: getattr(base, export) for export in __all__})
+
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -16,6 +17,10 @@ class BaseReader(ABC, BaseModel):
     def load_data(self) -> List[Document]:
         """Loads data."""
 
+    async def aload_data(self, *args, **kwargs) -> List[Document]:
+        """Asynchronously loads data, runs `load_data` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.load_data, *args, **kwargs)
+
     def load(self) -> List[Document]:
         return self.load_data()
 
@@ -1,12 +1,18 @@
-import glob
+import asyncio
 import os
-from pathlib import Path
-from typing import List, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging import getLogger
+from typing import Dict, List, Literal, Optional, Tuple, Type
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
+from pydantic.v1 import PrivateAttr
 
+logger = getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
 def _loading_default_supported_readers():
     try:
         from pineflow.readers.file import DocxReader, HTMLReader, PDFReader
@@ -34,6 +40,10 @@ class DirectoryReader(BaseReader):
             Only files with these extensions will be loaded. Defaults to `None` (no filtering).
         recursive (bool, optional): Whether to recursively search subdirectories for files.
             Defaults to `False`.
+        max_workers (int, optional): Maximum number of threads used to read files concurrently.
+            Defaults to `None` (the `ThreadPoolExecutor` default).
+        on_error (str, optional): What to do when a file cannot be read. `raise` stops the load,
+            `skip` logs a warning and continues with the remaining files. Defaults to `raise`.
 
     Example:
         .. code-block:: python
@@ -46,6 +56,110 @@ class DirectoryReader(BaseReader):
     required_exts: List[str] = [".pdf", ".docx", ".html"]
     recursive: Optional[bool] = False
     file_loader: Optional[dict[str, Type[BaseReader]]] = None
+    max_workers: Optional[int] = None
+    on_error: Literal["raise", "skip"] = "raise"
+
+    _ext_readers: Optional[Tuple[Tuple, Dict[str, Optional[BaseReader]]]] = PrivateAttr(
+        default=None,
+    )
+
+    def _get_ext_readers(self) -> Dict[str, Optional[BaseReader]]:
+        # Readers are stateless, one instance per extension is shared by all files.
+        # The cache is keyed on the fields it is built from, so later changes are honored.
+        cache_key = (
+            tuple(self.required_exts),
+            tuple(self.file_loader.items()) if self.file_loader is not None else None,
+        )
+
+        if self._ext_readers is None or self._ext_readers[0] != cache_key:
+            # The default readers mapping is shared across instances, never mutate it
+            file_loader = (
+                self.file_loader
+                if self.file_loader is not None
+                else _loading_default_supported_readers()
+            )
+
+            ext_readers = {}
+            for extension in self.required_exts:
+                loader_cls = file_loader.get(extension)
+                ext_readers[extension.lower()] = loader_cls() if loader_cls else None
+
+            self._ext_readers = (cache_key, ext_readers)
+
+        return self._ext_readers[1]
+
+    def _get_files_to_load(self, input_dir: str) -> List[Tuple[BaseReader, str]]:
+        if not os.path.isdir(input_dir):
+            raise ValueError(f"`{input_dir}` is not a valid directory.")
+
+        # Single pass over the directory tree, dispatching each file by its suffix
+        ext_readers = self._get_ext_readers()
+        files_to_load = []
+
+        # Hidden files and directories are skipped, as `glob` does
+        if self.recursive:
+            file_dirs = []
+            for root, dirs, names in os.walk(input_dir):
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+                file_dirs.extend(
+                    os.path.join(root, name)
+                    for name in names
+                    if not name.startswith(".")
+                )
+        else:
+            with os.scandir(input_dir) as entries:
+                file_dirs = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_file() and not entry.name.startswith(".")
+                ]
+
+        for file_dir in file_dirs:
+            extension = os.path.splitext(file_dir)[1].lower()
+            if extension not in ext_readers:
+                continue
+
+            reader = ext_readers[extension]
+            if reader:
+                files_to_load.append((reader, file_dir))
+            else:
+                # TODO add `unstructured file` support
+                raise ValueError(f"Unsupported file type: {extension}")
+
+        return files_to_load
+
+    def _handle_load_error(self, file_dir: str, error: Exception) -> List[Document]:
+        if self.on_error == "skip":
+            logger.warning(f"Skipping {file_dir}: {error}")
+            return []
+        raise RuntimeError(f"Error reading {file_dir}: {error}") from error
+
+    def load_file(self, input_file: str) -> List[Document]:
+        """
+        Loads a single file with the reader registered for its extension.
+
+        Files whose extension is not in `required_exts` are ignored.
+
+        Args:
+            input_file (str): File path to load.
+
+        Returns:
+            List[Document]: A list of documents loaded from the file.
+        """
+        extension = os.path.splitext(input_file)[1].lower()
+        ext_readers = self._get_ext_readers()
+        if extension not in ext_readers:
+            return []
+
+        reader = ext_readers[extension]
+        if not reader:
+            # TODO add `unstructured file` support
+            raise ValueError(f"Unsupported file type: {extension}")
+
+        try:
+            return reader.load_data(input_file)
+        except Exception as e:
+            return self._handle_load_error(input_file, e)
 
     def load_data(self, input_dir: str) -> List[Document]:
         """
@@ -57,34 +171,56 @@ class DirectoryReader(BaseReader):
         Returns:
             List[Document]: A list of documents loaded from the directory.
         """
-        if not os.path.isdir(input_dir):
-            raise ValueError(f"`{input_dir}` is not a valid directory.")
+        files_to_load = self._get_files_to_load(input_dir)
 
-        if self.file_loader is None:
-            self.file_loader = _loading_default_supported_readers()
+        def _load_file(file_to_load) -> List[Document]:
+            reader, file_dir = file_to_load
+            try:
+                # TODO add `file_reader_kwargs`
+                return reader.load_data(file_dir)
+            except Exception as e:
+                return self._handle_load_error(file_dir, e)
 
-        input_dir = Path(input_dir)
         documents = []
 
-        pattern_prefix = "**/*" if self.recursive else ""
+        # Reading and parsing files is I/O bound, overlap it across threads.
+        # `map` keeps the documents in the same order as the files.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for docs in executor.map(_load_file, files_to_load):
+                documents.extend(docs)
 
-        for extension in self.required_exts:
-            files = glob.glob(
-                os.path.join(input_dir, pattern_prefix + extension),
-                recursive=self.recursive,
-            )
+        return documents
+
+    async def aload_data(self, input_dir: str) -> List[Document]:
+        """
+        Asynchronously loads data from the specified directory.
 
-            for file_dir in files:
-                loader_cls = self.file_loader.get(extension)
-                if loader_cls:
-                    try:
-                        # TODO add `file_reader_kwargs`
-                        doc = loader_cls().load_data(file_dir)
-                        documents.extend(doc)
-                    except Exception as e:
-                        raise f"Error reading {file_dir}: {e}"
-                else:
-                    # TODO add `unstructured file` support
-                    raise f"Unsupported file type: {extension}"
+        Files are loaded concurrently through each reader's `aload_data`, at most
+        `max_workers` at a time.
 
-        return documents
+        Args:
+            input_dir (str): Directory path from which to load the documents.
+
+        Returns:
+            List[Document]: A list of documents loaded from the directory.
+        """
+        files_to_load = self._get_files_to_load(input_dir)
+
+        # Same bound as `load_data`, `None` falls back to the `ThreadPoolExecutor` default
+        semaphore = asyncio.Semaphore(
+            self.max_workers or min(32, (os.cpu_count() or 1) + 4)
+        )
+
+        async def _aload_file(reader: BaseReader, file_dir: str) -> List[Document]:
+            async with semaphore:
+                try:
+                    return await reader.aload_data(file_dir)
+                except Exception as e:
+                    return self._handle_load_error(file_dir, e)
+
+        # `gather` keeps the documents in the same order as the files
+        results = await asyncio.gather(
+            *(_aload_file(reader, file_dir) for reader, file_dir in files_to_load),
+        )
+
+        return [doc for docs in results for doc in docs]
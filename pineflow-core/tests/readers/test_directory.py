@@ -0,0 +1,89 @@
+import asyncio
+from pathlib import Path
+from typing import List
+
+import pytest
+from pineflow.core.document import Document
+from pineflow.core.readers import BaseReader, DirectoryReader
+
+
+class _PathReader(BaseReader):
+    def load_data(self, input_file: str) -> List[Document]:
+        return [Document(text=input_file)]
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    (tmp_path / "ok.pdf").write_text("")
+    (tmp_path / "._ok.pdf").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.pdf").write_text("")
+    (tmp_path / "sub" / ".nested.pdf").write_text("")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "secret.pdf").write_text("")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("recursive", "expected"),
+    [(False, {"ok.pdf"}), (True, {"ok.pdf", "sub/nested.pdf"})],
+)
+def test_load_data_skips_hidden_files_and_directories(input_dir, recursive, expected):
+    reader = DirectoryReader(
+        required_exts=[".pdf"],
+        recursive=recursive,
+        file_loader={".pdf": _PathReader},
+    )
+
+    documents = reader.load_data(str(input_dir))
+
+    loaded = {
+        Path(doc.get_content()).relative_to(input_dir).as_posix() for doc in documents
+    }
+    assert loaded == expected
+
+
+def test_load_data_honors_changed_fields(input_dir):
+    (input_dir / "page.html").write_text("")
+    reader = DirectoryReader(
+        required_exts=[".pdf"],
+        file_loader={".pdf": _PathReader, ".html": _PathReader},
+    )
+    assert len(reader.load_data(str(input_dir))) == 1
+
+    reader.required_exts = [".html"]
+    documents = reader.load_data(str(input_dir))
+
+    assert [Path(doc.get_content()).name for doc in documents] == ["page.html"]
+
+    reader.required_exts.append(".pdf")
+    assert len(reader.load_data(str(input_dir))) == 2
+
+
+def test_aload_data_honors_max_workers(tmp_path):
+    for i in range(6):
+        (tmp_path / f"{i}.pdf").write_text("")
+
+    running = 0
+    peak = 0
+
+    class _SlowReader(_PathReader):
+        async def aload_data(self, input_file: str) -> List[Document]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return self.load_data(input_file)
+
+    reader = DirectoryReader(
+        required_exts=[".pdf"],
+        file_loader={".pdf": _SlowReader},
+        max_workers=2,
+    )
+
+    documents = asyncio.run(reader.aload_data(str(tmp_path)))
+
+    assert len(documents) == 6
+    assert peak == 2
@@ -0,0 +1,20 @@
+import sys
+import warnings
+
+
+def test_deprecation_warning_fires_once(monkeypatch):
+    monkeypatch.delitem(sys.modules, "pineflow.core.observability", raising=False)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+
+        import pineflow.core.observability as observability
+
+        assert not caught
+
+        from pineflow.core.observability import BaseObservability, ModelObservability
+
+        assert observability.ModelObservability is ModelObservability
+        assert issubclass(ModelObservability, BaseObservability)
+
+    assert [warning.category for warning in caught] == [DeprecationWarning]
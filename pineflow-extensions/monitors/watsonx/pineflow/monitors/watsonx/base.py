@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 import datetime
-import json
+import functools
+import importlib.util
 import logging
-import os
+import time
 import uuid
 import warnings
-from typing import Any, Dict, List, Literal, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import certifi
 from deprecated import deprecated
@@ -13,7 +17,6 @@ from pineflow.core.monitors.types import PayloadRecord
 from pineflow.core.prompts.utils import extract_template_vars
 from pydantic.v1 import BaseModel
 
-os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
 logging.getLogger("ibm_watsonx_ai.client").setLevel(logging.ERROR)
 logging.getLogger("ibm_watsonx_ai.wml_resource").setLevel(logging.ERROR)
 
@@ -36,6 +39,108 @@ REGIONS_URL = {
 }
 
 
+_REQUIRED_PACKAGES = (
+    ("ibm_aigov_facts_client", "ibm-aigov-facts-client"),
+    ("ibm_cloud_sdk_core", "ibm-cloud-sdk-core"),
+    ("ibm_watson_openscale", "ibm-watson-openscale"),
+    ("ibm_watsonx_ai", "ibm-watsonx-ai"),
+)
+
+
+_PROMPT_SETUP_RUNNING_STATES = {"preparing", "running"}
+
+
+@functools.lru_cache(maxsize=1)
+def _ca_bundle() -> str:
+    """Resolves the certifi CA bundle path on first use."""
+    return certifi.where()
+
+
+def _is_unauthorized(error: Exception) -> bool:
+    """Checks whether an SDK error was caused by an expired or invalid token."""
+    status_code = getattr(error, "code", None) or getattr(
+        getattr(error, "response", None), "status_code", None
+    )
+    return status_code == 401
+
+
+@functools.lru_cache(maxsize=1)
+def _openscale_models():
+    """Imports the openscale v2 model classes once and reuses the module."""
+    from ibm_watson_openscale.base_classes import watson_open_scale_v2  # type: ignore
+
+    return watson_open_scale_v2
+
+
+def _check_required_packages() -> None:
+    """Checks the IBM SDKs are installed without importing them."""
+    for module_name, package_name in _REQUIRED_PACKAGES:
+        if importlib.util.find_spec(module_name) is None:
+            raise ImportError(
+                f"{package_name} package not found, please install it with `pip install {package_name}`",
+            )
+
+
+def _create_wos_client(
+    api_key: Optional[str],
+    service_url: str,
+    wos_cpd_creds: Optional[Dict] = None,
+):
+    """
+    Creates an IBM watsonx.governance (openscale) client.
+
+    Args:
+        api_key (str, optional): The API key for IBM watsonx.governance (IBM Cloud).
+        service_url (str): The openscale URL for the IBM Cloud region.
+        wos_cpd_creds (Dict, optional): The Cloud Pak for Data credentials for openscale.
+    """
+    from ibm_watson_openscale import APIClient as WosAPIClient  # type: ignore
+
+    try:
+        if wos_cpd_creds:
+            from ibm_cloud_sdk_core.authenticators import (
+                CloudPakForDataAuthenticator,  # type: ignore
+            )
+
+            authenticator = CloudPakForDataAuthenticator(**wos_cpd_creds)
+            wos_client = WosAPIClient(
+                authenticator=authenticator,
+                service_url=wos_cpd_creds["url"],
+            )
+
+        else:
+            from ibm_cloud_sdk_core.authenticators import (
+                IAMAuthenticator,  # type: ignore
+            )
+
+            authenticator = IAMAuthenticator(apikey=api_key)
+            wos_client = WosAPIClient(
+                authenticator=authenticator,
+                service_url=service_url,
+            )
+
+        wos_client.set_http_config({"verify": _ca_bundle()})
+        # Each client keeps its own session, the SDK retries transient errors on it
+        wos_client.enable_retries(max_retries=3)
+
+    except Exception as e:
+        logging.error(
+            f"Error connecting to IBM watsonx.governance (openscale): {e}",
+        )
+        raise
+
+    return wos_client
+
+
+def _resolve_region_urls(region: str) -> Dict[str, Optional[str]]:
+    try:
+        return REGIONS_URL[region]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported region '{region}'. Supported regions: {list(REGIONS_URL)}.",
+        ) from None
+
+
 def _filter_dict(original_dict: Dict, optional_keys: List, required_keys: List = []):
     """
     Filters a dictionary to keep only the specified keys and checks for required keys.
@@ -63,8 +168,9 @@ def _filter_dict(original_dict: Dict, optional_keys: List, required_keys: List =
 def _convert_payload_format(
     records: List[Dict],
     feature_fields: List[str],
-) -> List[Dict]:
+) -> Tuple[List[Dict], List[str]]:
     payload_data = []
+    scoring_ids = []
     response_fields = ["generated_text", "input_token_count", "generated_token_count"]
 
     for record in records:
@@ -79,18 +185,126 @@ def _convert_payload_format(
             field: record.get(field) for field in response_fields if record.get(field)
         }
 
+        scoring_id = str(uuid.uuid4())
         pl_record = {
             "request": request,
             "response": {"results": [results]},
-            "scoring_id": str(uuid.uuid4()),
+            "scoring_id": scoring_id,
         }
 
         if "response_time" in record:
             pl_record["response_time"] = record["response_time"]
 
         payload_data.append(pl_record)
+        scoring_ids.append(scoring_id + "-1")
+
+    return payload_data, scoring_ids
+
+
+def _get_data_mart_id(client) -> str:
+    """
+    Returns the ID of the openscale data mart, looked up once and cached on the client.
+
+    Args:
+        client: A monitor or custom metric client exposing `_ensure_wos_client` and `_data_mart_id`.
+    """
+    if client._data_mart_id is None:
+        data_marts = client._ensure_wos_client().data_marts.list().result.data_marts
+        if not data_marts:
+            raise ValueError(
+                "Error retrieving IBM watsonx.governance (openscale) data mart. "
+                "Make sure the data mart are configured.",
+            )
+
+        client._data_mart_id = data_marts[0].metadata.id
+
+    return client._data_mart_id
+
+
+def _get_payload_logging_details(monitor, subscription_id: str) -> Tuple[List, str]:
+    """
+    Returns the feature fields and payload data set ID of a subscription.
+
+    Both never change for a subscription, so they are cached on the monitor.
+
+    Args:
+        monitor: A prompt monitor exposing `_ensure_wos_client` and `_subscription_cache`.
+        subscription_id (str): The subscription ID.
+    """
+    if subscription_id not in monitor._subscription_cache:
+        from ibm_watson_openscale.supporting_classes.enums import (
+            DataSetTypes,
+            TargetTypes,
+        )
+
+        wos_client = monitor._ensure_wos_client()
+
+        subscription_details = wos_client.subscriptions.get(
+            subscription_id,
+        ).result.to_dict()
+
+        feature_fields = subscription_details["entity"]["asset_properties"][
+            "feature_fields"
+        ]
+
+        payload_data_set_id = (
+            wos_client.data_sets.list(
+                type=DataSetTypes.PAYLOAD_LOGGING,
+                target_target_id=subscription_id,
+                target_target_type=TargetTypes.SUBSCRIPTION,
+            )
+            .result.data_sets[0]
+            .metadata.id
+        )
+
+        monitor._subscription_cache[subscription_id] = (
+            feature_fields,
+            payload_data_set_id,
+        )
+
+    return monitor._subscription_cache[subscription_id]
+
+
+def _store_payload_records(
+    monitor,
+    records_request: List[Dict],
+    subscription_id: Optional[str] = None,
+) -> List[str]:
+    """
+    Stores records to the payload logging system of a prompt monitor subscription.
 
-    return payload_data
+    Args:
+        monitor: A prompt monitor exposing `subscription_id`, `_ensure_wos_client` and `_subscription_cache`.
+        records_request (List[Dict]): A list of records to be logged.
+        subscription_id (str, optional): The subscription ID associated with the records being logged.
+    """
+    # Expected behavior: Prefer using fn `subscription_id`.
+    # Fallback to `monitor.subscription_id` if `subscription_id` None or empty.
+    _subscription_id = subscription_id or monitor.subscription_id
+
+    if _subscription_id is None or _subscription_id == "":
+        raise ValueError(
+            "Unexpected value for 'subscription_id': Cannot be None or empty string."
+        )
+
+    wos_client = monitor._ensure_wos_client()
+    feature_fields, payload_data_set_id = _get_payload_logging_details(
+        monitor,
+        _subscription_id,
+    )
+
+    payload_data, scoring_ids = _convert_payload_format(
+        records_request,
+        feature_fields,
+    )
+
+    wos_client.data_sets.store_records(
+        data_set_id=payload_data_set_id,
+        request_body=payload_data,
+        background_mode=False,
+    )
+
+    return scoring_ids
 
 
 # ===== Credentials Classes =====
@@ -142,13 +356,13 @@ class CloudPakforDataCredentials(BaseModel):
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        cpd_creds = Dict([(k, v) for k, v in self.__dict__.items()])  # noqa: C404
+        cpd_creds = self.__dict__.copy()
 
-        if "instance_id" in cpd_creds and self.instance_id.lower() not in [
+        if isinstance(self.instance_id, str) and self.instance_id.lower() not in {
             "icp",
             "openshift",
-        ]:
-            cpd_creds.pop("instance_id")
+        }:
+            cpd_creds.pop("instance_id", None)
 
         return cpd_creds
 
@@ -229,49 +443,11 @@ class IntegratedSystemCredentials(BaseModel):
 
 
 # ===== Monitor Classes =====
-class WatsonxExternalPromptMonitor(ModelMonitor):
-    """
-    Provides functionality to interact with IBM watsonx.governance for monitoring external LLMs.
-
-    Note:
-        One of the following parameters is required to create a prompt monitor:
-        `project_id` or `space_id`, but not both.
-
-    Args:
-        api_key (str): The API key for IBM watsonx.governance.
-        space_id (str, optional): The space ID in watsonx.governance.
-        project_id (str, optional): The project ID in watsonx.governance.
-        region (str, optional): The region where watsonx.governance is hosted when using IBM Cloud.
-            Defaults to `us-south`.
-        cpd_creds (CloudPakforDataCredentials, optional): The Cloud Pak for Data environment credentials.
-        subscription_id (str, optional): The subscription ID associated with the records being logged.
-
-    Example:
-        .. code-block:: python
-
-            from pineflow.monitors.watsonx import (
-                WatsonxExternalPromptMonitor,
-                CloudPakforDataCredentials,
-            )
-
-            # watsonx.governance (IBM Cloud)
-            wxgov_client = WatsonxExternalPromptMonitor(
-                api_key="API_KEY", space_id="SPACE_ID"
-            )
-
-            # watsonx.governance (CP4D)
-            cpd_creds = CloudPakforDataCredentials(
-                url="CPD_URL",
-                username="USERNAME",
-                password="PASSWORD",
-                version="5.0",
-                instance_id="openshift",
-            )
+class _WatsonxPromptMonitorBase(ModelMonitor):
+    """Shared implementation of the IBM watsonx.governance prompt monitors."""
 
-            wxgov_client = WatsonxExternalPromptMonitor(
-                space_id="SPACE_ID", cpd_creds=cpd_creds
-            )
-    """
+    # `ConfigurationMetaNames` entry that sets the type of the prompt template deployment
+    _deployment_meta_name: str
 
     def __init__(
         self,
@@ -283,19 +459,22 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
         subscription_id: str = None,
         **kwargs,
     ) -> None:
-        import ibm_aigov_facts_client  # noqa: F401
-        import ibm_cloud_sdk_core.authenticators  # noqa: F401
-        import ibm_watson_openscale  # noqa: F401
-        import ibm_watsonx_ai  # noqa: F401
+        _check_required_packages()
 
         super().__init__(**kwargs)
 
         self.space_id = space_id
         self.project_id = project_id
         self.region = region
+        self._urls = _resolve_region_urls(region)
         self.subscription_id = subscription_id
         self._api_key = api_key
         self._wos_client = None
+        self._subscription_cache: Dict[str, Tuple[List, str]] = {}
+        self._data_mart_id = None
+        self._aigov_client = None
+        self._wml_client = None
+        self._wml_default_space_set = None
 
         self._container_id = space_id if space_id else project_id
         self._container_type = "space" if space_id else "project"
@@ -326,152 +505,156 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
                 ["url"],
             )
 
-    def _create_detached_prompt(
-        self,
-        detached_details: Dict,
-        prompt_template_details: Dict,
-        detached_asset_details: Dict,
-    ) -> str:
-        from ibm_aigov_facts_client import (  # type: ignore
-            AIGovFactsClient,
-            CloudPakforDataConfig,
-            DetachedPromptTemplate,
-            PromptTemplate,
-        )
+    def _ensure_wos_client(self):
+        if not self._wos_client:
+            self._wos_client = _create_wos_client(
+                self._api_key,
+                self._urls["wos"],
+                getattr(self, "_wos_cpd_creds", None),
+            )
 
-        try:
-            if hasattr(self, "_fact_cpd_creds") and self._fact_cpd_creds:
-                cpd_creds = CloudPakforDataConfig(**self._fact_cpd_creds)
+        return self._wos_client
 
-                aigov_client = AIGovFactsClient(
-                    container_id=self._container_id,
-                    container_type=self._container_type,
-                    cloud_pak_for_data_configs=cpd_creds,
-                    disable_tracing=True,
-                )
+    def _ensure_aigov_client(self):
+        if not self._aigov_client:
+            from ibm_aigov_facts_client import (  # type: ignore
+                AIGovFactsClient,
+                CloudPakforDataConfig,
+            )
+
+            try:
+                if hasattr(self, "_fact_cpd_creds") and self._fact_cpd_creds:
+                    cpd_creds = CloudPakforDataConfig(**self._fact_cpd_creds)
+
+                    self._aigov_client = AIGovFactsClient(
+                        container_id=self._container_id,
+                        container_type=self._container_type,
+                        cloud_pak_for_data_configs=cpd_creds,
+                        disable_tracing=True,
+                    )
+
+                else:
+                    self._aigov_client = AIGovFactsClient(
+                        api_key=self._api_key,
+                        container_id=self._container_id,
+                        container_type=self._container_type,
+                        disable_tracing=True,
+                        region=self._urls["factsheet"],
+                    )
 
-            else:
-                aigov_client = AIGovFactsClient(
-                    api_key=self._api_key,
-                    container_id=self._container_id,
-                    container_type=self._container_type,
-                    disable_tracing=True,
-                    region=REGIONS_URL[self.region]["factsheet"],
+            except Exception as e:
+                logging.error(
+                    f"Error connecting to IBM watsonx.governance (factsheets): {e}",
                 )
+                raise
 
-        except Exception as e:
-            logging.error(
-                f"Error connecting to IBM watsonx.governance (factsheets): {e}",
-            )
-            raise
+        return self._aigov_client
 
-        created_detached_pta = aigov_client.assets.create_detached_prompt(
-            **detached_asset_details,
-            prompt_details=PromptTemplate(**prompt_template_details),
-            detached_information=DetachedPromptTemplate(**detached_details),
-        )
+    def _ensure_wml_client(self):
+        if not self._wml_client:
+            from ibm_watsonx_ai import APIClient, Credentials  # type: ignore
 
-        return created_detached_pta.to_dict()["asset_id"]
+            # `verify` is left unset: the SDK copies it into `os.environ` and, when unset,
+            # falls back to unverified requests for self-signed (CP4D) certificates
+            try:
+                if hasattr(self, "_wml_cpd_creds") and self._wml_cpd_creds:
+                    creds = Credentials(**self._wml_cpd_creds)
 
-    def _create_deployment_pta(self, asset_id: str, name: str, model_id: str) -> str:
-        from ibm_watsonx_ai import APIClient, Credentials  # type: ignore
+                else:
+                    creds = Credentials(url=self._urls["wml"], api_key=self._api_key)
 
-        try:
-            if hasattr(self, "_wml_cpd_creds") and self._wml_cpd_creds:
-                creds = Credentials(**self._wml_cpd_creds)
+                self._wml_client = APIClient(creds)
+                self._wml_default_space_set = None
 
-                wml_client = APIClient(creds)
-                wml_client.set.default_space(self.space_id)
+            except Exception as e:
+                logging.error(f"Error connecting to IBM watsonx.ai Runtime: {e}")
+                raise
 
-            else:
-                creds = Credentials(
-                    url=REGIONS_URL[self.region]["wml"],
-                    api_key=self._api_key,
-                )
-                wml_client = APIClient(creds)
-                wml_client.set.default_space(self.space_id)
+        # `set.default_space` validates the space remotely, only scope the client when it changes
+        if self._wml_default_space_set != self.space_id:
+            self._wml_client.set.default_space(self.space_id)
+            self._wml_default_space_set = self.space_id
 
-        except Exception as e:
-            logging.error(f"Error connecting to IBM watsonx.ai Runtime: {e}")
-            raise
+        return self._wml_client
 
-        meta_props = {
-            wml_client.deployments.ConfigurationMetaNames.PROMPT_TEMPLATE: {
-                "id": asset_id,
-            },
-            wml_client.deployments.ConfigurationMetaNames.DETACHED: {},
-            wml_client.deployments.ConfigurationMetaNames.NAME: name
-            + " "
-            + "deployment",
-            wml_client.deployments.ConfigurationMetaNames.BASE_MODEL_ID: model_id,
-        }
+    def _create_deployment_pta(self, asset_id: str, name: str, model_id: str) -> str:
+        for attempt in range(2):
+            wml_client = self._ensure_wml_client()
+            meta_props = {
+                wml_client.deployments.ConfigurationMetaNames.PROMPT_TEMPLATE: {
+                    "id": asset_id,
+                },
+                getattr(
+                    wml_client.deployments.ConfigurationMetaNames,
+                    self._deployment_meta_name,
+                ): {},
+                wml_client.deployments.ConfigurationMetaNames.NAME: name
+                + " "
+                + "deployment",
+                wml_client.deployments.ConfigurationMetaNames.BASE_MODEL_ID: model_id,
+            }
+
+            try:
+                created_deployment = wml_client.deployments.create(asset_id, meta_props)
+                break
 
-        created_deployment = wml_client.deployments.create(asset_id, meta_props)
+            except Exception as e:
+                # The cached client token may have expired, reconnect once
+                if attempt == 0 and _is_unauthorized(e):
+                    self._wml_client = None
+                    continue
+                raise
 
         return wml_client.deployments.get_uid(created_deployment)
 
-    def add_prompt_monitor(
+    def _await_prompt_setup(
         self,
-        name: str,
-        model_id: str,
-        task_id: Literal[
-            "extraction",
-            "generation",
-            "question_answering",
-            "retrieval_augmented_generation",
-            "summarization",
-        ],
-        detached_model_provider: str,
-        description: str = "",
-        model_parameters: Dict = None,
-        detached_model_name: str = None,
-        detached_model_url: str = None,
-        detached_prompt_url: str = None,
-        detached_prompt_additional_info: Dict = None,
-        prompt_variables: List[str] = None,
-        locale: str = None,
-        input_text: str = None,
-        context_fields: List[str] = None,
-        question_field: str = None,
-    ) -> Dict:
-        """
-        Creates a Detached/External Prompt Template Asset and sets up monitors for a given prompt template asset.
+        prompt_template_asset_id: str,
+        deployment_id: str = None,
+        timeout: float = 600,
+    ):
+        wos_client = self._ensure_wos_client()
+        deadline = time.monotonic() + timeout
+        delay = 1.0
+
+        while True:
+            prompt_setup = wos_client.wos.get_prompt_setup(
+                prompt_template_asset_id=prompt_template_asset_id,
+                project_id=self.project_id,
+                space_id=self.space_id,
+                deployment_id=deployment_id,
+            ).result
+            state = prompt_setup.status.state.lower()
+
+            if state == "finished":
+                return prompt_setup
+
+            # Any other settled state, such as `failed` or `upload_error`, is a failure
+            if state not in _PROMPT_SETUP_RUNNING_STATES:
+                failure = getattr(prompt_setup.status, "failure", None)
+                errors = [
+                    f"code: {error.code}, message: {error.message}"
+                    for error in (getattr(failure, "errors", None) or [])
+                ]
+                raise Exception(
+                    f"IBM watsonx.governance (openscale) prompt setup failed with status: {state}. "
+                    f"Reason: {errors}",
+                )
 
-        Args:
-            name (str): The name of the External Prompt Template Asset.
-            model_id (str): The ID of the model associated with the prompt.
-            task_id (str): The task identifier.
-            detached_model_provider (str): The external model provider.
-            description (str, optional): A description of the External Prompt Template Asset.
-            model_parameters (Dict, optional): Model parameters and their respective values.
-            detached_model_name (str, optional): The name of the external model.
-            detached_model_url (str, optional): The URL of the external model.
-            detached_prompt_url (str, optional): The URL of the external prompt.
-            detached_prompt_additional_info (Dict, optional): Additional information related to the external prompt.
-            prompt_variables (List[str], optional): Values for the prompt variables.
-            locale (str, optional): Locale code for the input/output language. eg. "en", "pt", "es".
-            input_text (str, optional): The input text for the prompt.
-            context_fields (List[str], optional): A list of fields that will provide context to the prompt.
-                Applicable only for "retrieval_augmented_generation" task type.
-            question_field (str, optional): The field containing the question to be answered.
-                Applicable only for "retrieval_augmented_generation" task type.
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(
+                    f"IBM watsonx.governance (openscale) prompt setup did not finish within {timeout} seconds.",
+                )
 
-        Example:
-            .. code-block:: python
+            time.sleep(delay)
+            delay = min(delay * 2, 30.0)
 
-                wxgov_client.add_prompt_monitor(
-                    name="Detached prompt (model AWS Anthropic)",
-                    model_id="anthropic.claude-v2",
-                    task_id="retrieval_augmented_generation",
-                    detached_model_provider="AWS Bedrock",
-                    detached_model_name="Anthropic Claude 2.0",
-                    detached_model_url="https://docs.aws.amazon.com/bedrock/latest/userguide/model-parameters-claude.html",
-                    prompt_variables=["context1", "context2", "input_query"],
-                    input_text="Prompt text to be given",
-                    context_fields=["context1", "context2"],
-                    question_field="input_query",
-                )
-        """
+    def _validate_prompt_monitor_args(
+        self,
+        task_id: str,
+        context_fields: Optional[List[str]],
+        question_field: Optional[str],
+    ) -> None:
         if (not (self.project_id or self.space_id)) or (
             self.project_id and self.space_id
         ):
@@ -486,120 +669,46 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
                     "For 'retrieval_augmented_generation' task, requires non-empty 'context_fields' and 'question_field'."
                 )
 
-        prompt_metadata = locals()
-        # Remove unused vars from dict
-        prompt_metadata.pop("self", None)
-        prompt_metadata.pop("context_fields", None)
-        prompt_metadata.pop("question_field", None)
-        prompt_metadata.pop("locale", None)
-
-        # Update name of keys to aigov_facts api
-        prompt_metadata["input"] = prompt_metadata.pop("input_text", None)
-        prompt_metadata["model_provider"] = prompt_metadata.pop(
-            "detached_model_provider",
-            None,
-        )
-        prompt_metadata["model_name"] = prompt_metadata.pop("detached_model_name", None)
-        prompt_metadata["model_url"] = prompt_metadata.pop("detached_model_url", None)
-        prompt_metadata["prompt_url"] = prompt_metadata.pop("detached_prompt_url", None)
-        prompt_metadata["prompt_additional_info"] = prompt_metadata.pop(
-            "detached_prompt_additional_info",
-            None,
-        )
-
-        # Update list of vars to dict
-        prompt_metadata["prompt_variables"] = Dict.fromkeys(
-            prompt_metadata["prompt_variables"], ""
-        )
+    def _execute_prompt_setup(
+        self,
+        prompt_template_asset_id: str,
+        deployment_id: Optional[str],
+        task_id: str,
+        locale: Optional[str],
+        context_fields: Optional[List[str]],
+        question_field: Optional[str],
+        wait: bool,
+    ) -> Optional[str]:
+        """Sets up the monitors of a prompt template asset and returns its subscription ID."""
+        wos_client = self._ensure_wos_client()
 
-        from ibm_watson_openscale import APIClient as WosAPIClient  # type: ignore
+        monitors = {
+            "generative_ai_quality": {
+                "parameters": {"min_sample_size": 10, "metrics_configuration": {}},
+            },
+        }
 
-        if not self._wos_client:
+        max_attempt_execute_prompt_setup = 0
+        while max_attempt_execute_prompt_setup < 2:
             try:
-                if hasattr(self, "_wos_cpd_creds") and self._wos_cpd_creds:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        CloudPakForDataAuthenticator,  # type: ignore
-                    )
+                generative_ai_monitor_details = wos_client.wos.execute_prompt_setup(
+                    prompt_template_asset_id=prompt_template_asset_id,
+                    space_id=self.space_id,
+                    project_id=self.project_id,
+                    deployment_id=deployment_id,
+                    label_column="reference_output",
+                    context_fields=context_fields,
+                    question_field=question_field,
+                    operational_space_id=self._deployment_stage,
+                    problem_type=task_id,
+                    data_input_locale=[locale],
+                    generated_output_locale=[locale],
+                    input_data_type="unstructured_text",
+                    supporting_monitors=monitors,
+                    background_mode=True,
+                ).result
 
-                    authenticator = CloudPakForDataAuthenticator(**self._wos_cpd_creds)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=self._wos_cpd_creds["url"],
-                    )
-
-                else:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        IAMAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = IAMAuthenticator(apikey=self._api_key)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=REGIONS_URL[self.region]["wos"],
-                    )
-
-            except Exception as e:
-                logging.error(
-                    f"Error connecting to IBM watsonx.governance (openscale): {e}",
-                )
-                raise
-
-        detached_details = _filter_dict(
-            prompt_metadata,
-            ["model_name", "model_url", "prompt_url", "prompt_additional_info"],
-            ["model_id", "model_provider"],
-        )
-        detached_details["prompt_id"] = "detached_prompt_" + str(uuid.uuid4())
-
-        prompt_details = _filter_dict(
-            prompt_metadata,
-            ["prompt_variables", "input", "model_parameters"],
-        )
-
-        detached_asset_details = _filter_dict(
-            prompt_metadata,
-            ["description"],
-            ["name", "model_id", "task_id"],
-        )
-
-        detached_pta_id = self._create_detached_prompt(
-            detached_details,
-            prompt_details,
-            detached_asset_details,
-        )
-        deployment_id = None
-        if self._container_type == "space":
-            deployment_id = self._create_deployment_pta(detached_pta_id, name, model_id)
-
-        monitors = {
-            "generative_ai_quality": {
-                "parameters": {"min_sample_size": 10, "metrics_configuration": {}},
-            },
-        }
-
-        max_attempt_execute_prompt_setup = 0
-        while max_attempt_execute_prompt_setup < 2:
-            try:
-                generative_ai_monitor_details = (
-                    self._wos_client.wos.execute_prompt_setup(
-                        prompt_template_asset_id=detached_pta_id,
-                        space_id=self.space_id,
-                        project_id=self.project_id,
-                        deployment_id=deployment_id,
-                        label_column="reference_output",
-                        context_fields=context_fields,
-                        question_field=question_field,
-                        operational_space_id=self._deployment_stage,
-                        problem_type=task_id,
-                        data_input_locale=[locale],
-                        generated_output_locale=[locale],
-                        input_data_type="unstructured_text",
-                        supporting_monitors=monitors,
-                        background_mode=False,
-                    ).result
-                )
-
-                break
+                break
 
             except Exception as e:
                 if (
@@ -611,17 +720,8 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
                         max_attempt_execute_prompt_setup + 1
                     )
 
-                    data_marts = self._wos_client.data_marts.list().result
-                    if (data_marts.data_marts is None) or (not data_marts.data_marts):
-                        raise ValueError(
-                            "Error retrieving IBM watsonx.governance (openscale) data mart. \
-                                         Make sure the data mart are configured.",
-                        )
-
-                    data_mart_id = data_marts.data_marts[0].metadata.id
-
-                    self._wos_client.wos.add_instance_mapping(
-                        service_instance_id=data_mart_id,
+                    wos_client.wos.add_instance_mapping(
+                        service_instance_id=_get_data_mart_id(self),
                         space_id=self.space_id,
                         project_id=self.project_id,
                     )
@@ -629,13 +729,14 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
                     max_attempt_execute_prompt_setup = 2
                     raise
 
-        generative_ai_monitor_details = generative_ai_monitor_details._to_dict()
+        if wait:
+            generative_ai_monitor_details = self._await_prompt_setup(
+                prompt_template_asset_id,
+                deployment_id,
+            )
 
-        return {
-            "detached_prompt_template_asset_id": detached_pta_id,
-            "deployment_id": deployment_id,
-            "subscription_id": generative_ai_monitor_details["subscription_id"],
-        }
+        # The subscription is not known yet when the setup runs in the background
+        return generative_ai_monitor_details._to_dict().get("subscription_id")
 
     def store_payload_records(
         self,
@@ -646,7 +747,7 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
         Stores records to the payload logging system.
 
         Args:
-            records_request (List[Dict]): A list of records to be logged, where each record is represented as a dictionary.
+            records_request (List[Dict]): A list of records to be logged. Each record is represented as a dictionary.
             subscription_id (str, optional): The subscription ID associated with the records being logged.
 
         Example:
@@ -666,80 +767,52 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
                     subscription_id="5d62977c-a53d-4b6d-bda1-7b79b3b9d1a0",
                 )
         """
-        from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-        from ibm_watson_openscale import APIClient as WosAPIClient
-        from ibm_watson_openscale.supporting_classes.enums import (
-            DataSetTypes,
-            TargetTypes,
-        )
-
-        # Expected behavior: Prefer using fn `subscription_id`.
-        # Fallback to `self.subscription_id` if `subscription_id` None or empty.
-        _subscription_id = subscription_id or self.subscription_id
-
-        if _subscription_id is None or _subscription_id == "":
-            raise ValueError(
-                "Unexpected value for 'subscription_id': Cannot be None or empty string."
-            )
-
-        if not self._wos_client:
-            try:
-                if hasattr(self, "_wos_cpd_creds") and self._wos_cpd_creds:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        CloudPakForDataAuthenticator,  # type: ignore
-                    )
+        return _store_payload_records(self, records_request, subscription_id)
 
-                    authenticator = CloudPakForDataAuthenticator(**self._wos_cpd_creds)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=self._wos_cpd_creds["url"],
-                    )
+    def store_payload_records_bulk(
+        self,
+        records_request: List[Dict],
+        subscription_id: str = None,
+        batch_size: int = 500,
+        max_workers: int = 8,
+    ) -> List[str]:
+        """
+        Stores a large list of records to the payload logging system in concurrent batches.
 
-                else:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        IAMAuthenticator,  # type: ignore
-                    )
+        Args:
+            records_request (List[Dict]): A list of records to be logged. Each record is represented as a dictionary.
+            subscription_id (str, optional): The subscription ID associated with the records being logged.
+            batch_size (int, optional): The maximum number of records sent per request. Defaults to `500`.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to `8`.
 
-                    authenticator = IAMAuthenticator(apikey=self._api_key)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=REGIONS_URL[self.region]["wos"],
-                    )
+        Example:
+            .. code-block:: python
 
-            except Exception as e:
-                logging.error(
-                    f"Error connecting to IBM watsonx.governance (openscale): {e}",
+                wxgov_client.store_payload_records_bulk(
+                    records_request=records,
+                    subscription_id="5d62977c-a53d-4b6d-bda1-7b79b3b9d1a0",
+                    batch_size=200,
                 )
-                raise
-
-        subscription_details = self._wos_client.subscriptions.get(
-            _subscription_id,
-        ).result
-        subscription_details = json.loads(str(subscription_details))
-
-        feature_fields = subscription_details["entity"]["asset_properties"][
-            "feature_fields"
+        """
+        batches = [
+            records_request[i : i + batch_size]
+            for i in range(0, len(records_request), batch_size)
         ]
+        if not batches:
+            return []
 
-        payload_data_set_id = (
-            self._wos_client.data_sets.list(
-                type=DataSetTypes.PAYLOAD_LOGGING,
-                target_target_id=_subscription_id,
-                target_target_type=TargetTypes.SUBSCRIPTION,
-            )
-            .result.data_sets[0]
-            .metadata.id
-        )
-
-        payload_data = _convert_payload_format(records_request, feature_fields)
+        # The first batch validates the subscription and warms the client and
+        # payload logging cache before requests are issued concurrently
+        scoring_ids = self.store_payload_records(batches[0], subscription_id)
 
-        self._wos_client.data_sets.store_records(
-            data_set_id=payload_data_set_id,
-            request_body=payload_data,
-            background_mode=False,
-        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch_scoring_ids in executor.map(
+                lambda batch: self.store_payload_records(batch, subscription_id),
+                batches[1:],
+            ):
+                scoring_ids.extend(batch_scoring_ids)
 
-        return [data["scoring_id"] + "-1" for data in payload_data]
+        return scoring_ids
 
     def __call__(self, payload: PayloadRecord) -> None:
         if self.prompt_template:
@@ -753,9 +826,9 @@ class WatsonxExternalPromptMonitor(ModelMonitor):
             self.store_payload_records([{**payload.model_dump(), **template_vars}])
 
 
-class WatsonxPromptMonitor(ModelMonitor):
+class WatsonxExternalPromptMonitor(_WatsonxPromptMonitorBase):
     """
-    Provides functionality to interact with IBM watsonx.governance for monitoring IBM watsonx.ai LLMs.
+    Provides functionality to interact with IBM watsonx.governance for monitoring external LLMs.
 
     Note:
         One of the following parameters is required to create a prompt monitor:
@@ -774,12 +847,14 @@ class WatsonxPromptMonitor(ModelMonitor):
         .. code-block:: python
 
             from pineflow.monitors.watsonx import (
-                WatsonxPromptMonitor,
+                WatsonxExternalPromptMonitor,
                 CloudPakforDataCredentials,
             )
 
             # watsonx.governance (IBM Cloud)
-            wxgov_client = WatsonxPromptMonitor(api_key="API_KEY", space_id="SPACE_ID")
+            wxgov_client = WatsonxExternalPromptMonitor(
+                api_key="API_KEY", space_id="SPACE_ID"
+            )
 
             # watsonx.governance (CP4D)
             cpd_creds = CloudPakforDataCredentials(
@@ -790,146 +865,240 @@ class WatsonxPromptMonitor(ModelMonitor):
                 instance_id="openshift",
             )
 
-            wxgov_client = WatsonxPromptMonitor(
+            wxgov_client = WatsonxExternalPromptMonitor(
                 space_id="SPACE_ID", cpd_creds=cpd_creds
             )
     """
 
-    def __init__(
-        self,
-        api_key: str = None,
-        space_id: str = None,
-        project_id: str = None,
-        region: Literal["us-south", "eu-de", "au-syd"] = "us-south",
-        cpd_creds: CloudPakforDataCredentials | Dict = None,
-        subscription_id: str = None,
-        **kwargs,
-    ) -> None:
-        import ibm_aigov_facts_client  # noqa: F401
-        import ibm_cloud_sdk_core.authenticators  # noqa: F401
-        import ibm_watson_openscale  # noqa: F401
-        import ibm_watsonx_ai  # noqa: F401
-
-        super().__init__(**kwargs)
-
-        self.space_id = space_id
-        self.project_id = project_id
-        self.region = region
-        self.subscription_id = subscription_id
-        self._api_key = api_key
-        self._wos_client = None
-
-        self._container_id = space_id if space_id else project_id
-        self._container_type = "space" if space_id else "project"
-        self._deployment_stage = "production" if space_id else "development"
-
-        if cpd_creds:
-            self._wos_cpd_creds = _filter_dict(
-                cpd_creds.to_dict(),
-                ["username", "password", "api_key", "disable_ssl_verification"],
-                ["url"],
-            )
-            self._fact_cpd_creds = _filter_dict(
-                cpd_creds.to_dict(),
-                ["username", "password", "api_key", "bedrock_url"],
-                ["url"],
-            )
-            self._fact_cpd_creds["service_url"] = self._fact_cpd_creds.pop("url")
-            self._wml_cpd_creds = _filter_dict(
-                cpd_creds.to_dict(),
-                [
-                    "username",
-                    "password",
-                    "api_key",
-                    "instance_id",
-                    "version",
-                    "bedrock_url",
-                ],
-                ["url"],
-            )
+    _deployment_meta_name = "DETACHED"
 
-    def _create_prompt_template(
+    def _create_detached_prompt(
         self,
+        detached_details: Dict,
         prompt_template_details: Dict,
-        asset_details: Dict,
+        detached_asset_details: Dict,
     ) -> str:
-        from ibm_aigov_facts_client import (
-            AIGovFactsClient,
-            CloudPakforDataConfig,
+        from ibm_aigov_facts_client import (  # type: ignore
+            DetachedPromptTemplate,
             PromptTemplate,
         )
 
-        try:
-            if hasattr(self, "_fact_cpd_creds") and self._fact_cpd_creds:
-                cpd_creds = CloudPakforDataConfig(**self._fact_cpd_creds)
-
-                aigov_client = AIGovFactsClient(
-                    container_id=self._container_id,
-                    container_type=self._container_type,
-                    cloud_pak_for_data_configs=cpd_creds,
-                    disable_tracing=True,
+        for attempt in range(2):
+            try:
+                created_pta = self._ensure_aigov_client().assets.create_detached_prompt(
+                    **detached_asset_details,
+                    prompt_details=PromptTemplate(**prompt_template_details),
+                    detached_information=DetachedPromptTemplate(**detached_details),
                 )
+                break
+
+            except Exception as e:
+                # The cached client token may have expired, reconnect once
+                if attempt == 0 and _is_unauthorized(e):
+                    self._aigov_client = None
+                    continue
+                raise
+
+        return created_pta.to_dict()["asset_id"]
+
+    def add_prompt_monitor(
+        self,
+        name: str,
+        model_id: str,
+        task_id: Literal[
+            "extraction",
+            "generation",
+            "question_answering",
+            "retrieval_augmented_generation",
+            "summarization",
+        ],
+        detached_model_provider: str,
+        description: str = "",
+        model_parameters: Dict = None,
+        detached_model_name: str = None,
+        detached_model_url: str = None,
+        detached_prompt_url: str = None,
+        detached_prompt_additional_info: Dict = None,
+        prompt_variables: List[str] = None,
+        locale: str = None,
+        input_text: str = None,
+        context_fields: List[str] = None,
+        question_field: str = None,
+        wait: bool = True,
+    ) -> Dict:
+        """
+        Creates a Detached/External Prompt Template Asset and sets up monitors for a given prompt template asset.
+
+        Args:
+            name (str): The name of the External Prompt Template Asset.
+            model_id (str): The ID of the model associated with the prompt.
+            task_id (str): The task identifier.
+            detached_model_provider (str): The external model provider.
+            description (str, optional): A description of the External Prompt Template Asset.
+            model_parameters (Dict, optional): Model parameters and their respective values.
+            detached_model_name (str, optional): The name of the external model.
+            detached_model_url (str, optional): The URL of the external model.
+            detached_prompt_url (str, optional): The URL of the external prompt.
+            detached_prompt_additional_info (Dict, optional): Additional information related to the external prompt.
+            prompt_variables (List[str], optional): Values for the prompt variables.
+            locale (str, optional): Locale code for the input/output language. eg. "en", "pt", "es".
+            input_text (str, optional): The input text for the prompt.
+            context_fields (List[str], optional): A list of fields that will provide context to the prompt.
+                Applicable only for "retrieval_augmented_generation" task type.
+            question_field (str, optional): The field containing the question to be answered.
+                Applicable only for "retrieval_augmented_generation" task type.
+            wait (bool, optional): Wait for the monitor setup to finish before returning. When `False`,
+                the setup runs in the background and `subscription_id` may be `None`. Defaults to `True`.
+
+        Example:
+            .. code-block:: python
 
-            else:
-                aigov_client = AIGovFactsClient(
-                    api_key=self._api_key,
-                    container_id=self._container_id,
-                    container_type=self._container_type,
-                    disable_tracing=True,
-                    region=REGIONS_URL[self.region]["factsheet"],
+                wxgov_client.add_prompt_monitor(
+                    name="Detached prompt (model AWS Anthropic)",
+                    model_id="anthropic.claude-v2",
+                    task_id="retrieval_augmented_generation",
+                    detached_model_provider="AWS Bedrock",
+                    detached_model_name="Anthropic Claude 2.0",
+                    detached_model_url="https://docs.aws.amazon.com/bedrock/latest/userguide/model-parameters-claude.html",
+                    prompt_variables=["context1", "context2", "input_query"],
+                    input_text="Prompt text to be given",
+                    context_fields=["context1", "context2"],
+                    question_field="input_query",
                 )
+        """
+        self._validate_prompt_monitor_args(task_id, context_fields, question_field)
+
+        # Keys follow the aigov_facts api naming
+        prompt_metadata = {
+            "name": name,
+            "model_id": model_id,
+            "task_id": task_id,
+            "description": description,
+            "model_parameters": model_parameters,
+            "model_provider": detached_model_provider,
+            "model_name": detached_model_name,
+            "model_url": detached_model_url,
+            "prompt_url": detached_prompt_url,
+            "prompt_additional_info": detached_prompt_additional_info,
+            "prompt_variables": dict.fromkeys(prompt_variables or [], ""),
+            "input": input_text,
+        }
 
-        except Exception as e:
-            logging.error(
-                f"Error connecting to IBM watsonx.governance (factsheets): {e}",
-            )
-            raise
+        # Connect before any asset is created
+        self._ensure_wos_client()
 
-        created_pta = aigov_client.assets.create_prompt(
-            **asset_details,
-            input_mode="freeform",
-            prompt_details=PromptTemplate(**prompt_template_details),
+        detached_details = _filter_dict(
+            prompt_metadata,
+            ["model_name", "model_url", "prompt_url", "prompt_additional_info"],
+            ["model_id", "model_provider"],
         )
+        detached_details["prompt_id"] = "detached_prompt_" + str(uuid.uuid4())
 
-        return created_pta.to_dict()["asset_id"]
+        prompt_details = _filter_dict(
+            prompt_metadata,
+            ["prompt_variables", "input", "model_parameters"],
+        )
 
-    def _create_deployment_pta(self, asset_id: str, name: str, model_id: str) -> str:
-        from ibm_watsonx_ai import APIClient, Credentials  # type: ignore
+        detached_asset_details = _filter_dict(
+            prompt_metadata,
+            ["description"],
+            ["name", "model_id", "task_id"],
+        )
+
+        detached_pta_id = self._create_detached_prompt(
+            detached_details,
+            prompt_details,
+            detached_asset_details,
+        )
+        deployment_id = None
+        if self._container_type == "space":
+            deployment_id = self._create_deployment_pta(detached_pta_id, name, model_id)
 
-        try:
-            if hasattr(self, "_wml_cpd_creds") and self._wml_cpd_creds:
-                creds = Credentials(**self._wml_cpd_creds)
+        subscription_id = self._execute_prompt_setup(
+            detached_pta_id,
+            deployment_id,
+            task_id,
+            locale,
+            context_fields,
+            question_field,
+            wait,
+        )
 
-                wml_client = APIClient(creds)
-                wml_client.set.default_space(self.space_id)
+        return {
+            "detached_prompt_template_asset_id": detached_pta_id,
+            "deployment_id": deployment_id,
+            "subscription_id": subscription_id,
+        }
 
-            else:
-                creds = Credentials(
-                    url=REGIONS_URL[self.region]["wml"],
-                    api_key=self._api_key,
-                )
 
-                wml_client = APIClient(creds)
-                wml_client.set.default_space(self.space_id)
+class WatsonxPromptMonitor(_WatsonxPromptMonitorBase):
+    """
+    Provides functionality to interact with IBM watsonx.governance for monitoring IBM watsonx.ai LLMs.
 
-        except Exception as e:
-            logging.error(f"Error connecting to IBM watsonx.ai Runtime: {e}")
-            raise
+    Note:
+        One of the following parameters is required to create a prompt monitor:
+        `project_id` or `space_id`, but not both.
 
-        meta_props = {
-            wml_client.deployments.ConfigurationMetaNames.PROMPT_TEMPLATE: {
-                "id": asset_id,
-            },
-            wml_client.deployments.ConfigurationMetaNames.FOUNDATION_MODEL: {},
-            wml_client.deployments.ConfigurationMetaNames.NAME: name
-            + " "
-            + "deployment",
-            wml_client.deployments.ConfigurationMetaNames.BASE_MODEL_ID: model_id,
-        }
+    Args:
+        api_key (str): The API key for IBM watsonx.governance.
+        space_id (str, optional): The space ID in watsonx.governance.
+        project_id (str, optional): The project ID in watsonx.governance.
+        region (str, optional): The region where watsonx.governance is hosted when using IBM Cloud.
+            Defaults to `us-south`.
+        cpd_creds (CloudPakforDataCredentials, optional): The Cloud Pak for Data environment credentials.
+        subscription_id (str, optional): The subscription ID associated with the records being logged.
+
+    Example:
+        .. code-block:: python
+
+            from pineflow.monitors.watsonx import (
+                WatsonxPromptMonitor,
+                CloudPakforDataCredentials,
+            )
+
+            # watsonx.governance (IBM Cloud)
+            wxgov_client = WatsonxPromptMonitor(api_key="API_KEY", space_id="SPACE_ID")
+
+            # watsonx.governance (CP4D)
+            cpd_creds = CloudPakforDataCredentials(
+                url="CPD_URL",
+                username="USERNAME",
+                password="PASSWORD",
+                version="5.0",
+                instance_id="openshift",
+            )
+
+            wxgov_client = WatsonxPromptMonitor(
+                space_id="SPACE_ID", cpd_creds=cpd_creds
+            )
+    """
+
+    _deployment_meta_name = "FOUNDATION_MODEL"
+
+    def _create_prompt_template(
+        self,
+        prompt_template_details: Dict,
+        asset_details: Dict,
+    ) -> str:
+        from ibm_aigov_facts_client import PromptTemplate  # type: ignore
+
+        for attempt in range(2):
+            try:
+                created_pta = self._ensure_aigov_client().assets.create_prompt(
+                    **asset_details,
+                    input_mode="freeform",
+                    prompt_details=PromptTemplate(**prompt_template_details),
+                )
+                break
 
-        created_deployment = wml_client.deployments.create(asset_id, meta_props)
+            except Exception as e:
+                # The cached client token may have expired, reconnect once
+                if attempt == 0 and _is_unauthorized(e):
+                    self._aigov_client = None
+                    continue
+                raise
 
-        return wml_client.deployments.get_uid(created_deployment)
+        return created_pta.to_dict()["asset_id"]
 
     def add_prompt_monitor(
         self,
@@ -949,6 +1118,7 @@ class WatsonxPromptMonitor(ModelMonitor):
         input_text: str = None,
         context_fields: List[str] = None,
         question_field: str = None,
+        wait: bool = True,
     ) -> Dict:
         """
         Creates an IBM Prompt Template Asset and sets up monitors for the given prompt template asset.
@@ -966,6 +1136,8 @@ class WatsonxPromptMonitor(ModelMonitor):
                 Applicable only for the `retrieval_augmented_generation` task type.
             question_field (str, optional): The field containing the question to be answered.
                 Applicable only for the `retrieval_augmented_generation` task type.
+            wait (bool, optional): Wait for the monitor setup to finish before returning. When `False`,
+                the setup runs in the background and `subscription_id` may be `None`. Defaults to `True`.
 
         Example:
             .. code-block:: python
@@ -980,68 +1152,21 @@ class WatsonxPromptMonitor(ModelMonitor):
                     question_field="input_query",
                 )
         """
-        if (not (self.project_id or self.space_id)) or (
-            self.project_id and self.space_id
-        ):
-            raise ValueError(
-                "Invalid configuration: Neither was provided: please set either 'project_id' or 'space_id'. "
-                "Both were provided: 'project_id' and 'space_id' cannot be set at the same time."
-            )
-
-        if task_id == "retrieval_augmented_generation":
-            if not context_fields or not question_field:
-                raise ValueError(
-                    "For 'retrieval_augmented_generation' task, requires non-empty 'context_fields' and 'question_field'."
-                )
-
-        prompt_metadata = locals()
-        # Remove unused vars from dict
-        prompt_metadata.pop("self", None)
-        prompt_metadata.pop("context_fields", None)
-        prompt_metadata.pop("question_field", None)
-        prompt_metadata.pop("locale", None)
-
-        # Update name of keys to aigov_facts api
-        prompt_metadata["input"] = prompt_metadata.pop("input_text", None)
-
-        # Update list of vars to dict
-        prompt_metadata["prompt_variables"] = Dict.fromkeys(
-            prompt_metadata["prompt_variables"], ""
-        )
-
-        from ibm_cloud_sdk_core.authenticators import IAMAuthenticator  # type: ignore
-        from ibm_watson_openscale import APIClient as WosAPIClient  # type: ignore
-
-        if not self._wos_client:
-            try:
-                if hasattr(self, "_wos_cpd_creds") and self._wos_cpd_creds:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        CloudPakForDataAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = CloudPakForDataAuthenticator(**self._wos_cpd_creds)
-
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=self._wos_cpd_creds["url"],
-                    )
-
-                else:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        IAMAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = IAMAuthenticator(apikey=self._api_key)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=REGIONS_URL[self.region]["wos"],
-                    )
+        self._validate_prompt_monitor_args(task_id, context_fields, question_field)
+
+        # Keys follow the aigov_facts api naming
+        prompt_metadata = {
+            "name": name,
+            "model_id": model_id,
+            "task_id": task_id,
+            "description": description,
+            "model_parameters": model_parameters,
+            "prompt_variables": dict.fromkeys(prompt_variables or [], ""),
+            "input": input_text,
+        }
 
-            except Exception as e:
-                logging.error(
-                    f"Error connecting to IBM watsonx.governance (openscale): {e}",
-                )
-                raise
+        # Connect before any asset is created
+        self._ensure_wos_client()
 
         prompt_details = _filter_dict(
             prompt_metadata,
@@ -1059,188 +1184,22 @@ class WatsonxPromptMonitor(ModelMonitor):
         if self._container_type == "space":
             deployment_id = self._create_deployment_pta(pta_id, name, model_id)
 
-        monitors = {
-            "generative_ai_quality": {
-                "parameters": {"min_sample_size": 10, "metrics_configuration": {}},
-            },
-        }
-
-        max_attempt_execute_prompt_setup = 0
-        while max_attempt_execute_prompt_setup < 2:
-            try:
-                generative_ai_monitor_details = (
-                    self._wos_client.wos.execute_prompt_setup(
-                        prompt_template_asset_id=pta_id,
-                        space_id=self.space_id,
-                        project_id=self.project_id,
-                        deployment_id=deployment_id,
-                        label_column="reference_output",
-                        context_fields=context_fields,
-                        question_field=question_field,
-                        operational_space_id=self._deployment_stage,
-                        problem_type=task_id,
-                        data_input_locale=[locale],
-                        generated_output_locale=[locale],
-                        input_data_type="unstructured_text",
-                        supporting_monitors=monitors,
-                        background_mode=False,
-                    ).result
-                )
-
-                break
-
-            except Exception as e:
-                if (
-                    e.code == 403
-                    and "The user entitlement does not exist" in e.message
-                    and max_attempt_execute_prompt_setup < 1
-                ):
-                    max_attempt_execute_prompt_setup = (
-                        max_attempt_execute_prompt_setup + 1
-                    )
-
-                    data_marts = self._wos_client.data_marts.list().result
-                    if (data_marts.data_marts is None) or (not data_marts.data_marts):
-                        raise ValueError(
-                            "Error retrieving IBM watsonx.governance (openscale) data mart. \
-                                         Make sure the data mart are configured.",
-                        )
-
-                    data_mart_id = data_marts.data_marts[0].metadata.id
-
-                    self._wos_client.wos.add_instance_mapping(
-                        service_instance_id=data_mart_id,
-                        space_id=self.space_id,
-                        project_id=self.project_id,
-                    )
-                else:
-                    max_attempt_execute_prompt_setup = 2
-                    raise
-
-        generative_ai_monitor_details = generative_ai_monitor_details._to_dict()
+        subscription_id = self._execute_prompt_setup(
+            pta_id,
+            deployment_id,
+            task_id,
+            locale,
+            context_fields,
+            question_field,
+            wait,
+        )
 
         return {
             "prompt_template_asset_id": pta_id,
             "deployment_id": deployment_id,
-            "subscription_id": generative_ai_monitor_details["subscription_id"],
+            "subscription_id": subscription_id,
         }
 
-    def store_payload_records(
-        self,
-        records_request: List[Dict],
-        subscription_id: str = None,
-    ) -> List[str]:
-        """
-        Stores records to the payload logging system.
-
-        Args:
-            records_request (List[Dict]): A list of records to be logged. Each record is represented as a dictionary.
-            subscription_id (str, optional): The subscription ID associated with the records being logged.
-
-        Example:
-            .. code-block:: python
-
-                wxgov_client.store_payload_records(
-                    records_request=[
-                        {
-                            "context1": "value_context1",
-                            "context2": "value_context1",
-                            "input_query": "What's Pineflow?",
-                            "generated_text": "Pineflow is a data framework to make AI easier to work with.",
-                            "input_token_count": 25,
-                            "generated_token_count": 150,
-                        }
-                    ],
-                    subscription_id="5d62977c-a53d-4b6d-bda1-7b79b3b9d1a0",
-                )
-        """
-        from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-        from ibm_watson_openscale import APIClient as WosAPIClient
-        from ibm_watson_openscale.supporting_classes.enums import (
-            DataSetTypes,
-            TargetTypes,
-        )
-
-        # Expected behavior: Prefer using fn `subscription_id`.
-        # Fallback to `self.subscription_id` if `subscription_id` None or empty.
-        _subscription_id = subscription_id or self.subscription_id
-
-        if _subscription_id is None or _subscription_id == "":
-            raise ValueError(
-                "Unexpected value for 'subscription_id': Cannot be None or empty string."
-            )
-
-        if not self._wos_client:
-            try:
-                if hasattr(self, "_wos_cpd_creds") and self._wos_cpd_creds:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        CloudPakForDataAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = CloudPakForDataAuthenticator(**self._wos_cpd_creds)
-
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=self._wos_cpd_creds["url"],
-                    )
-
-                else:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        IAMAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = IAMAuthenticator(apikey=self._api_key)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=REGIONS_URL[self.region]["wos"],
-                    )
-
-            except Exception as e:
-                logging.error(
-                    f"Error connecting to IBM watsonx.governance (openscale): {e}",
-                )
-                raise
-
-        subscription_details = self._wos_client.subscriptions.get(
-            _subscription_id,
-        ).result
-        subscription_details = json.loads(str(subscription_details))
-
-        feature_fields = subscription_details["entity"]["asset_properties"][
-            "feature_fields"
-        ]
-
-        payload_data_set_id = (
-            self._wos_client.data_sets.list(
-                type=DataSetTypes.PAYLOAD_LOGGING,
-                target_target_id=_subscription_id,
-                target_target_type=TargetTypes.SUBSCRIPTION,
-            )
-            .result.data_sets[0]
-            .metadata.id
-        )
-
-        payload_data = _convert_payload_format(records_request, feature_fields)
-
-        self._wos_client.data_sets.store_records(
-            data_set_id=payload_data_set_id,
-            request_body=payload_data,
-            background_mode=False,
-        )
-
-        return [data["scoring_id"] + "-1" for data in payload_data]
-
-    def __call__(self, payload: PayloadRecord) -> None:
-        if self.prompt_template:
-            template_vars = extract_template_vars(
-                self.prompt_template.template, payload.input_text
-            )
-
-        if not template_vars:
-            self.store_payload_records([payload.model_dump()])
-        else:
-            self.store_payload_records([{**payload.model_dump(), **template_vars}])
-
 
 # ===== Supporting Classes =====
 class WatsonxLocalMetric(BaseModel):
@@ -1264,6 +1223,9 @@ class WatsonxLocalMetric(BaseModel):
     data_type: Literal["string", "integer", "double", "timestamp"]
     nullable: bool = True
 
+    class Config:
+        frozen = True
+
     def to_dict(self) -> Dict:
         return {"name": self.name, "type": self.data_type, "nullable": self.nullable}
 
@@ -1287,6 +1249,9 @@ class WatsonxMetricThreshold(BaseModel):
     threshold_type: Literal["lower_limit", "upper_limit"]
     default_value: float = None
 
+    class Config:
+        frozen = True
+
     def to_dict(self) -> Dict:
         return {"type": self.threshold_type, "default": self.default_value}
 
@@ -1329,20 +1294,23 @@ class WatsonxMetric(BaseModel):
     ]
     thresholds: Optional[List[WatsonxMetricThreshold]] = None
 
+    class Config:
+        frozen = True
+
     def to_dict(self) -> Dict:
-        from ibm_watson_openscale.base_classes.watson_open_scale_v2 import (
-            ApplicabilitySelection,
-            MetricThreshold,
-        )
+        wos_models = _openscale_models()
 
         monitor_metric = {
             "name": self.name,
-            "applies_to": ApplicabilitySelection(problem_type=self.applies_to),
+            "applies_to": wos_models.ApplicabilitySelection(
+                problem_type=self.applies_to
+            ),
         }
 
         if self.thresholds is not None:
             monitor_metric["thresholds"] = [
-                MetricThreshold(**threshold.to_dict()) for threshold in self.thresholds
+                wos_models.MetricThreshold(**threshold.to_dict())
+                for threshold in self.thresholds
             ]
 
         return monitor_metric
@@ -1382,18 +1350,22 @@ class WatsonxCustomMetric:
             wxgov_client = WatsonxCustomMetric(cpd_creds=cpd_creds)
     """
 
+    # Deprecation notices are emitted once per process, not on every publish call
+    _custom_local_metric_id_warned = False
+
     def __init__(
         self,
         api_key: str = None,
         region: Literal["us-south", "eu-de", "au-syd"] = "us-south",
         cpd_creds: CloudPakforDataCredentials | Dict = None,
     ) -> None:
-        from ibm_cloud_sdk_core.authenticators import IAMAuthenticator  # type: ignore
-        from ibm_watson_openscale import APIClient as WosAPIClient  # type: ignore
+        _check_required_packages()
 
         self.region = region
+        self._urls = _resolve_region_urls(region)
         self._api_key = api_key
         self._wos_client = None
+        self._data_mart_id = None
 
         if cpd_creds:
             self._wos_cpd_creds = _filter_dict(
@@ -1402,36 +1374,15 @@ class WatsonxCustomMetric:
                 ["url"],
             )
 
+    def _ensure_wos_client(self):
         if not self._wos_client:
-            try:
-                if hasattr(self, "_wos_cpd_creds") and self._wos_cpd_creds:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        CloudPakForDataAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = CloudPakForDataAuthenticator(**self._wos_cpd_creds)
-
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=self._wos_cpd_creds["url"],
-                    )
-
-                else:
-                    from ibm_cloud_sdk_core.authenticators import (
-                        IAMAuthenticator,  # type: ignore
-                    )
-
-                    authenticator = IAMAuthenticator(apikey=self._api_key)
-                    self._wos_client = WosAPIClient(
-                        authenticator=authenticator,
-                        service_url=REGIONS_URL[self.region]["wos"],
-                    )
+            self._wos_client = _create_wos_client(
+                self._api_key,
+                self._urls["wos"],
+                getattr(self, "_wos_cpd_creds", None),
+            )
 
-            except Exception as e:
-                logging.error(
-                    f"Error connecting to IBM watsonx.governance (openscale): {e}",
-                )
-                raise
+        return self._wos_client
 
     def _add_integrated_system(
         self,
@@ -1439,7 +1390,8 @@ class WatsonxCustomMetric:
         name: str,
         endpoint: str,
     ) -> str:
-        custom_metrics_integrated_system = self._wos_client.integrated_systems.add(
+        wos_client = self._ensure_wos_client()
+        custom_metrics_integrated_system = wos_client.integrated_systems.add(
             name=name,
             description="Integrated system created from Pineflow.",
             type="custom_metrics_provider",
@@ -1455,38 +1407,36 @@ class WatsonxCustomMetric:
         monitor_metrics: List[WatsonxMetric],
         schedule: bool,
     ):
-        from ibm_watson_openscale.base_classes.watson_open_scale_v2 import (
-            ApplicabilitySelection,
-            MonitorInstanceSchedule,
-            MonitorMetricRequest,
-            MonitorRuntime,
-            ScheduleStartTime,
-        )
+        wos_models = _openscale_models()
 
         _monitor_metrics = [
-            MonitorMetricRequest(**metric.to_dict()) for metric in monitor_metrics
+            wos_models.MonitorMetricRequest(**metric.to_dict())
+            for metric in monitor_metrics
         ]
         _monitor_runtime = None
         _monitor_schedule = None
 
         if schedule:
-            _monitor_runtime = MonitorRuntime(type="custom_metrics_provider")
-            _monitor_schedule = MonitorInstanceSchedule(
+            _monitor_runtime = wos_models.MonitorRuntime(type="custom_metrics_provider")
+            _monitor_schedule = wos_models.MonitorInstanceSchedule(
                 repeat_interval=1,
                 repeat_unit="hour",
-                start_time=ScheduleStartTime(
+                start_time=wos_models.ScheduleStartTime(
                     type="relative",
                     delay_unit="minute",
                     delay=30,
                 ),
             )
 
-        custom_monitor_details = self._wos_client.monitor_definitions.add(
+        wos_client = self._ensure_wos_client()
+        custom_monitor_details = wos_client.monitor_definitions.add(
             name=name,
             metrics=_monitor_metrics,
             tags=[],
             schedule=_monitor_schedule,
-            applies_to=ApplicabilitySelection(input_data_type=["unstructured_text"]),
+            applies_to=wos_models.ApplicabilitySelection(
+                input_data_type=["unstructured_text"]
+            ),
             monitor_runtime=_monitor_runtime,
             background_mode=False,
         ).result
@@ -1494,7 +1444,8 @@ class WatsonxCustomMetric:
         return custom_monitor_details.metadata.id
 
     def _get_monitor_instance(self, subscription_id: str, monitor_definition_id: str):
-        monitor_instances = self._wos_client.monitor_instances.list(
+        wos_client = self._ensure_wos_client()
+        monitor_instances = wos_client.monitor_instances.list(
             monitor_definition_id=monitor_definition_id,
             target_target_id=subscription_id,
         ).result.monitor_instances
@@ -1521,36 +1472,16 @@ class WatsonxCustomMetric:
             },
         ]
 
-        return self._wos_client.monitor_instances.update(
+        wos_client = self._ensure_wos_client()
+        return wos_client.monitor_instances.update(
             custom_monitor_id,
             payload,
             update_metadata_only=True,
         ).result
 
-    def _get_patch_request_field(
-        self,
-        field_path: str,
-        field_value: Any,
-        op_name: str = "replace",
-    ) -> Dict:
-        return {"op": op_name, "path": field_path, "value": field_value}
-
-    def _get_dataset_id(
-        self,
-        subscription_id: str,
-        data_set_type: Literal["feedback", "payload_logging"],
-    ) -> str:
-        data_sets = self._wos_client.data_sets.list(
-            target_target_id=subscription_id,
-            type=data_set_type,
-        ).result.data_sets
-        data_set_id = None
-        if len(data_sets) > 0:
-            data_set_id = data_sets[0].metadata.id
-        return data_set_id
-
     def _get_dataset_data(self, data_set_id: str):
-        json_data = self._wos_client.data_sets.get_list_of_records(
+        wos_client = self._ensure_wos_client()
+        json_data = wos_client.data_sets.get_list_of_records(
             data_set_id=data_set_id,
             format="list",
         ).result
@@ -1560,14 +1491,16 @@ class WatsonxCustomMetric:
 
         return json_data["records"][0]
 
-    def _get_existing_data_mart(self):
-        data_marts = self._wos_client.data_marts.list().result.data_marts
-        if len(data_marts) == 0:
-            raise Exception(
-                "No data marts found. Please ensure at least one data mart is available.",
-            )
+    def invalidate_cache(self) -> None:
+        """
+        Clears the cached data mart ID, so it is looked up again on next use.
 
-        return data_marts[0].metadata.id
+        Example:
+            .. code-block:: python
+
+                wxgov_client.invalidate_cache()
+        """
+        self._data_mart_id = None
 
     # ===== Global Custom Metrics =====
     def add_metric_definition(
@@ -1642,7 +1575,8 @@ class WatsonxCustomMetric:
             },
         ]
 
-        self._wos_client.integrated_systems.update(integrated_system_id, payload)
+        wos_client = self._ensure_wos_client()
+        wos_client.integrated_systems.update(integrated_system_id, payload)
 
         return {
             "integrated_system_id": integrated_system_id,
@@ -1672,22 +1606,19 @@ class WatsonxCustomMetric:
                     subscription_id="0195e95d-03a4-7000-b954-b607db10fe9e",
                 )
         """
-        from ibm_watson_openscale.base_classes.watson_open_scale_v2 import Target
+        wos_models = _openscale_models()
 
-        data_marts = self._wos_client.data_marts.list().result.data_marts
-        if len(data_marts) == 0:
-            raise Exception(
-                "No data marts found. Please ensure at least one data mart is available.",
-            )
-
-        data_mart_id = data_marts[0].metadata.id
+        wos_client = self._ensure_wos_client()
+        data_mart_id = _get_data_mart_id(self)
         existing_monitor_instance = self._get_monitor_instance(
             subscription_id,
             monitor_definition_id,
         )
 
         if existing_monitor_instance is None:
-            target = Target(target_type="subscription", target_id=subscription_id)
+            target = wos_models.Target(
+                target_type="subscription", target_id=subscription_id
+            )
 
             parameters = {
                 "custom_metrics_provider_id": integrated_system_id,
@@ -1695,7 +1626,7 @@ class WatsonxCustomMetric:
                 "enable_custom_metric_runs": True,
             }
 
-            monitor_instance_details = self._wos_client.monitor_instances.create(
+            monitor_instance_details = wos_client.monitor_instances.create(
                 data_mart_id=data_mart_id,
                 background_mode=False,
                 monitor_definition_id=monitor_definition_id,
@@ -1734,35 +1665,64 @@ class WatsonxCustomMetric:
                     records_request={"context_quality": 0.914, "sensitivity": 0.85},
                 )
         """
-        from ibm_watson_openscale.base_classes.watson_open_scale_v2 import (
-            MonitorMeasurementRequest,
-            Runs,
+        return self.publish_metrics_bulk(
+            monitor_instance_id,
+            monitor_run_id,
+            [records_request],
         )
 
-        measurement_request = MonitorMeasurementRequest(
-            timestamp=datetime.datetime.now(datetime.timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-            ),
-            run_id=monitor_run_id,
-            metrics=[records_request],
+    def publish_metrics_bulk(
+        self,
+        monitor_instance_id: str,
+        monitor_run_id: str,
+        records_list: List[Dict[str, Union[float, int]]],
+    ):
+        """
+        Publishes several sets of computed custom metrics for a global monitor instance in a single request.
+
+        Args:
+            monitor_instance_id (str): The unique ID of the monitor instance.
+            monitor_run_id (str): The ID of the monitor run that generated the metrics.
+            records_list (List[Dict[str | float | int]]): List of dicts containing the metrics to be published.
+
+        Example:
+            .. code-block:: python
+
+                wxgov_client.publish_metrics_bulk(
+                    monitor_instance_id="01966801-f9ee-7248-a706-41de00a8a998",
+                    monitor_run_id="RUN_ID",
+                    records_list=[
+                        {"context_quality": 0.914, "sensitivity": 0.85},
+                        {"context_quality": 0.872, "sensitivity": 0.91},
+                    ],
+                )
+        """
+        wos_models = _openscale_models()
+
+        # Shared by the measurements and the run `completed_at`
+        timestamp = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S.%fZ",
         )
+        measurement_requests = [
+            wos_models.MonitorMeasurementRequest(
+                timestamp=timestamp,
+                run_id=monitor_run_id,
+                metrics=[records_request],
+            )
+            for records_request in records_list
+        ]
 
-        self._wos_client.monitor_instances.add_measurements(
+        wos_client = self._ensure_wos_client()
+        wos_client.monitor_instances.add_measurements(
             monitor_instance_id=monitor_instance_id,
-            monitor_measurement_request=[measurement_request],
+            monitor_measurement_request=measurement_requests,
         ).result
 
-        run = Runs(watson_open_scale=self._wos_client)
-        patch_payload = []
-        patch_payload.append(self._get_patch_request_field("/status/state", "finished"))
-        patch_payload.append(
-            self._get_patch_request_field(
-                "/status/completed_at",
-                datetime.datetime.now(datetime.timezone.utc).strftime(
-                    "%Y-%m-%dT%H:%M:%S.%fZ",
-                ),
-            ),
-        )
+        run = wos_models.Runs(watson_open_scale=wos_client)
+        patch_payload = [
+            {"op": "replace", "path": "/status/state", "value": "finished"},
+            {"op": "replace", "path": "/status/completed_at", "value": timestamp},
+        ]
 
         return run.update(
             monitor_instance_id=monitor_instance_id,
@@ -1798,31 +1758,29 @@ class WatsonxCustomMetric:
                     ],
                 )
         """
-        from ibm_watson_openscale.base_classes.watson_open_scale_v2 import (
-            LocationTableName,
-            SparkStruct,
-            SparkStructFieldPrimitive,
-            Target,
-        )
+        wos_models = _openscale_models()
 
-        target = Target(target_id=subscription_id, target_type="subscription")
-        data_mart_id = self._get_existing_data_mart()
+        target = wos_models.Target(
+            target_id=subscription_id, target_type="subscription"
+        )
+        data_mart_id = _get_data_mart_id(self)
         monitor_metrics = [
-            SparkStructFieldPrimitive(**metric.to_dict()) for metric in monitor_metrics
+            wos_models.SparkStructFieldPrimitive(**metric.to_dict())
+            for metric in monitor_metrics
         ]
 
         schema_fields = [
-            SparkStructFieldPrimitive(
+            wos_models.SparkStructFieldPrimitive(
                 name="scoring_id",
                 type="string",
                 nullable=False,
             ),
-            SparkStructFieldPrimitive(
+            wos_models.SparkStructFieldPrimitive(
                 name="run_id",
                 type="string",
                 nullable=True,
             ),
-            SparkStructFieldPrimitive(
+            wos_models.SparkStructFieldPrimitive(
                 name="computed_on",
                 type="string",
                 nullable=False,
@@ -1831,15 +1789,16 @@ class WatsonxCustomMetric:
 
         schema_fields.extend(monitor_metrics)
 
-        data_schema = SparkStruct(type="struct", fields=schema_fields)
+        data_schema = wos_models.SparkStruct(type="struct", fields=schema_fields)
 
-        return self._wos_client.data_sets.add(
+        wos_client = self._ensure_wos_client()
+        return wos_client.data_sets.add(
             target=target,
             name=name,
             type="custom",
             data_schema=data_schema,
             data_mart_id=data_mart_id,
-            location=LocationTableName(
+            location=wos_models.LocationTableName(
                 table_name=name.lower().replace(" ", "_") + "_" + str(uuid.uuid4())[:8],
             ),
             background_mode=False,
@@ -1891,20 +1850,66 @@ class WatsonxCustomMetric:
         """
         # START deprecated params message
         if custom_local_metric_id is not None:
-            warnings.warn(
-                "'custom_local_metric_id' is deprecated and will be removed. "
-                "Please use 'metric_instance_id' instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+            if not WatsonxCustomMetric._custom_local_metric_id_warned:
+                warnings.warn(
+                    "'custom_local_metric_id' is deprecated and will be removed. "
+                    "Please use 'metric_instance_id' instead.",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                WatsonxCustomMetric._custom_local_metric_id_warned = True
             if metric_instance_id is None:
                 metric_instance_id = custom_local_metric_id
         # END deprecated params message
-        return self._wos_client.data_sets.store_records(
+        wos_client = self._ensure_wos_client()
+        return wos_client.data_sets.store_records(
             data_set_id=metric_instance_id,
             request_body=records_request,
         ).result
 
+    def publish_local_metrics_bulk(
+        self,
+        metric_instance_id: str,
+        records_request: List[Dict],
+        batch_size: int = 500,
+        max_workers: int = 8,
+    ) -> List:
+        """
+        Publishes a large list of computed custom metrics for transaction records in concurrent batches.
+
+        Args:
+            metric_instance_id (str): The unique ID of the custom transaction metric.
+            records_request (List[Dict]): A list of dictionaries containing the records to be stored.
+            batch_size (int, optional): The maximum number of records sent per request. Defaults to `500`.
+            max_workers (int, optional): The maximum number of concurrent requests. Defaults to `8`.
+
+        Example:
+            .. code-block:: python
+
+                wxgov_client.publish_local_metrics_bulk(
+                    metric_instance_id="0196ad39-1b75-7e77-bddb-cc5393d575c2",
+                    records_request=records,
+                    batch_size=200,
+                )
+        """
+        batches = [
+            records_request[i : i + batch_size]
+            for i in range(0, len(records_request), batch_size)
+        ]
+        if not batches:
+            return []
+
+        # Warm the client before requests are issued concurrently
+        self._ensure_wos_client()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda batch: self.publish_local_metrics(metric_instance_id, batch),
+                    batches,
+                )
+            )
+
     def list_local_metrics(
         self,
         metric_instance_id: str,
@@ -1925,12 +1930,14 @@ class WatsonxCustomMetric:
         """
         # START deprecated params message
         if custom_local_metric_id is not None:
-            warnings.warn(
-                "'custom_local_metric_id' is deprecated and will be removed. "
-                "Please use 'metric_instance_id' instead.",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+            if not WatsonxCustomMetric._custom_local_metric_id_warned:
+                warnings.warn(
+                    "'custom_local_metric_id' is deprecated and will be removed. "
+                    "Please use 'metric_instance_id' instead.",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+                WatsonxCustomMetric._custom_local_metric_id_warned = True
             if metric_instance_id is None:
                 metric_instance_id = custom_local_metric_id
         # END deprecated params message
@@ -0,0 +1,138 @@
+import os
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import pytest
+from pineflow.monitors.watsonx import (
+    CloudPakforDataCredentials,
+    IntegratedSystemCredentials,
+    WatsonxExternalPromptMonitor,
+    WatsonxLocalMetric,
+    WatsonxPromptMonitor,
+    base,
+)
+
+
+@pytest.fixture(autouse=True)
+def _skip_package_check(monkeypatch):
+    monkeypatch.setattr(base, "_check_required_packages", lambda: None)
+
+
+def _mock_wos_client(setup_details: dict) -> MagicMock:
+    wos_client = MagicMock()
+    wos_client.wos.execute_prompt_setup.return_value.result._to_dict.return_value = (
+        setup_details
+    )
+    return wos_client
+
+
+@pytest.mark.parametrize(
+    ("monitor_cls", "create_method", "extra_kwargs", "asset_key"),
+    [
+        (
+            WatsonxPromptMonitor,
+            "_create_prompt_template",
+            {},
+            "prompt_template_asset_id",
+        ),
+        (
+            WatsonxExternalPromptMonitor,
+            "_create_detached_prompt",
+            {"detached_model_provider": "AWS Bedrock"},
+            "detached_prompt_template_asset_id",
+        ),
+    ],
+)
+def test_add_prompt_monitor_without_wait(
+    monkeypatch, monitor_cls, create_method, extra_kwargs, asset_key
+):
+    monitor = monitor_cls(api_key="API_KEY", project_id="PROJECT_ID")
+    # The background response does not know the subscription yet
+    wos_client = _mock_wos_client({"prompt_template_asset_id": "PTA_ID"})
+    monkeypatch.setattr(monitor, "_ensure_wos_client", lambda: wos_client)
+    monkeypatch.setattr(monitor, create_method, lambda *args: "PTA_ID")
+    await_prompt_setup = MagicMock()
+    monkeypatch.setattr(monitor, "_await_prompt_setup", await_prompt_setup)
+
+    result = monitor.add_prompt_monitor(
+        name="prompt",
+        model_id="model",
+        task_id="summarization",
+        wait=False,
+        **extra_kwargs,
+    )
+
+    assert result == {
+        asset_key: "PTA_ID",
+        "deployment_id": None,
+        "subscription_id": None,
+    }
+    assert wos_client.wos.execute_prompt_setup.call_args.kwargs["background_mode"]
+    await_prompt_setup.assert_not_called()
+
+
+def test_local_metric_to_dict_follows_copy_update():
+    metric = WatsonxLocalMetric(name="a", data_type="double")
+    assert metric.to_dict()["name"] == "a"
+
+    updated = metric.copy(update={"name": "zzz"})
+
+    assert updated.to_dict() == {"name": "zzz", "type": "double", "nullable": True}
+    assert metric.to_dict()["name"] == "a"
+
+
+def test_integrated_system_credentials_to_dict_is_not_shared():
+    creds = IntegratedSystemCredentials(auth_type="basic", username="u", password="p")
+
+    creds.to_dict()["username"] = "changed"
+
+    assert creds.to_dict() == {"auth_type": "basic", "username": "u", "password": "p"}
+    assert creds.copy(update={"password": "q"}).to_dict()["password"] == "q"
+
+
+@pytest.mark.parametrize(
+    "monitor_kwargs",
+    [
+        {"api_key": "API_KEY"},
+        {"cpd_creds": CloudPakforDataCredentials(url="URL", api_key="API_KEY")},
+    ],
+)
+def test_wml_client_leaves_environment_unchanged(monkeypatch, monitor_kwargs):
+    def _credentials(**kwargs):
+        # Mirrors the SDK, which exports any explicit `verify` to the environment
+        if kwargs.get("verify") is not None:
+            os.environ["WX_CLIENT_VERIFY_REQUESTS"] = str(kwargs["verify"])
+        return kwargs
+
+    ibm_watsonx_ai = ModuleType("ibm_watsonx_ai")
+    ibm_watsonx_ai.Credentials = MagicMock(side_effect=_credentials)
+    ibm_watsonx_ai.APIClient = MagicMock()
+    monkeypatch.setitem(sys.modules, "ibm_watsonx_ai", ibm_watsonx_ai)
+    monitor = WatsonxPromptMonitor(space_id="SPACE_ID", **monitor_kwargs)
+    environ = dict(os.environ)
+
+    monitor._ensure_wml_client()
+
+    assert dict(os.environ) == environ
+    assert "verify" not in ibm_watsonx_ai.Credentials.call_args.kwargs
+
+
+@pytest.mark.parametrize("state", ["upload_error", "active"])
+def test_await_prompt_setup_fails_on_settled_states(monkeypatch, state):
+    monitor = WatsonxPromptMonitor(api_key="API_KEY", project_id="PROJECT_ID")
+    error = MagicMock(code="AIQPS0001", message="Upload failed")
+    running, settled = MagicMock(), MagicMock()
+    running.status.state = "RUNNING"
+    settled.status.state = state
+    settled.status.failure.errors = [error]
+    wos_client = MagicMock()
+    wos_client.wos.get_prompt_setup.side_effect = [
+        MagicMock(result=running),
+        MagicMock(result=settled),
+    ]
+    monkeypatch.setattr(monitor, "_ensure_wos_client", lambda: wos_client)
+    monkeypatch.setattr(base.time, "sleep", lambda delay: None)
+
+    with pytest.raises(Exception, match=f"status: {state}.*AIQPS0001, message: Upload"):
+        monitor._await_prompt_setup("PTA_ID")
@@ -12,9 +12,13 @@ class HTMLReader(BaseReader):
 
     Args:
         tag (str): HTML tag to extract. Defaults to `section`.
+        parser (str): BeautifulSoup parser used to build the tree. Defaults to `html.parser`.
+            `lxml` is faster but requires `pip install lxml`, and may recover malformed
+            markup differently.
     """
 
     tag: str = "section"
+    parser: str = "html.parser"
 
     def load_data(self, input_file: str) -> List[Document]:
         """
@@ -27,7 +31,7 @@ class HTMLReader(BaseReader):
             List[Document]: A list of `Document` objects loaded from the file.
         """
         try:
-            from bs4 import BeautifulSoup  # noqa: F401
+            from bs4 import BeautifulSoup, SoupStrainer  # noqa: F401
         except ImportError:
             raise ImportError(
                 "beautifulsoup4 package not found, please install it with `pip install beautifulsoup4`",
@@ -38,8 +42,13 @@ class HTMLReader(BaseReader):
 
         input_file = str(Path(input_file).resolve())
 
+        # Only build the tree for the requested tag instead of the whole document
         with open(input_file, encoding="utf-8") as html_file:
-            soup = BeautifulSoup(html_file, "html.parser")
+            soup = BeautifulSoup(
+                html_file,
+                self.parser,
+                parse_only=SoupStrainer(self.tag),
+            )
 
         tags = soup.find_all(self.tag)
         documents = []
@@ -63,24 +72,18 @@ class HTMLReader(BaseReader):
 
     def _extract_text_from_tag(self, tag) -> str:
         """Extract the text from an HTML tag, ignoring other nested tags."""
-        try:
-            from bs4 import NavigableString  # noqa: F401
-        except ImportError:
-            raise ImportError(
-                "beautifulsoup4 package not found, please install it with `pip install beautifulsoup4`",
-            )
-
+        tag_name = self.tag
         texts = []
+        append = texts.append
 
         for elem in tag.children:
-            # Check if the element is a text node, not a tag
-            if isinstance(elem, NavigableString):
-                if elem.strip():
-                    texts.append(elem.strip())
+            # Text nodes (`NavigableString`) are `str` subclasses, tags are not
+            if isinstance(elem, str):
+                text = elem.strip()
+                if text:
+                    append(text)
             # Ignore any tag that matches the main tag being processed (to avoid recursion)
-            elif elem.name == self.tag:
-                continue
-            else:
-                texts.append(elem.get_text().strip())
+            elif elem.name != tag_name:
+                append(elem.get_text().strip())
 
         return "\n".join(texts)
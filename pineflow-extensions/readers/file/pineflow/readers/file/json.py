@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -7,6 +8,14 @@ from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
 
 
+@lru_cache
+def _compile_jq_schema(jq_schema: str):
+    """Compile and cache a jq schema."""
+    import jq
+
+    return jq.compile(jq_schema)
+
+
 class JSONReader(BaseReader):
     """
     JSON reader.
@@ -37,25 +46,22 @@ class JSONReader(BaseReader):
         if not os.path.isfile(input_file):
             raise ValueError(f"File `{input_file}` does not exist")
 
+        input_file = Path(input_file).resolve()
+        metadata = {"source": str(input_file)}
+
+        # `json.loads` accepts bytes directly, skipping the intermediate str decode
+        json_data = _compile_jq_schema(self.jq_schema).input(
+            json.loads(input_file.read_bytes())
+        )
         documents = []
-        jq_compiler = jq.compile(self.jq_schema)
-        json_file = Path(input_file).resolve().read_text(encoding="utf-8")
-        json_data = jq_compiler.input(json.loads(json_file))
 
         for content in json_data:
-            if isinstance(content, str):
-                content = content
-            elif isinstance(content, dict):
+            if isinstance(content, dict):
                 content = json.dumps(content) if content else ""
-            else:
+            elif not isinstance(content, str):
                 content = str(content) if content is not None else ""
 
             if content.strip() != "":
-                documents.append(
-                    Document(
-                        text=content,
-                        metadata={"source": str(Path(input_file).resolve())},
-                    ),
-                )
+                documents.append(Document(text=content, metadata=dict(metadata)))
 
         return documents
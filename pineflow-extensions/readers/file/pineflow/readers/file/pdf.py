@@ -1,27 +1,44 @@
 import logging
+import math
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
 
 logging.getLogger("pypdf").setLevel(logging.ERROR)
 
+# Below this page count the process pool start-up costs more than it saves
+_PARALLEL_PAGES_THRESHOLD = 32
+
+
+def _extract_pages_text(page_range: Tuple[str, int, int]) -> List[str]:
+    """Extracts the text of a contiguous range of pages, run in a worker process."""
+    import pypdf
+
+    input_file, start, stop = page_range
+    pages = pypdf.PdfReader(input_file).pages
+
+    return [pages[i].extract_text().strip() for i in range(start, stop)]
+
 
 class PDFReader(BaseReader):
-    """PDF reader using PyPDF."""
+    """
+    PDF reader using PyPDF.
 
-    def load_data(self, input_file: str) -> List[Document]:
-        """
-        Loads data from the specified file.
+    Args:
+        max_workers (int, optional): Number of processes used to extract the pages of large PDFs.
+            Defaults to `None` (pages are extracted serially). Leave it unset when the reader is already
+            run from a pool, e.g. by `DirectoryReader`. Workers are spawned, so the calling script
+            needs an `if __name__ == "__main__":` guard.
+    """
 
-        Args:
-            input_file (str): File path to load.
+    max_workers: Optional[int] = None
 
-        Returns:
-            List[Document]: A list of `Document` objects loaded from the file.
-        """
+    def _open_pdf(self, input_file: str):
         try:
             import pypdf  # noqa: F401
 
@@ -34,12 +51,74 @@ class PDFReader(BaseReader):
             raise ValueError(f"File `{input_file}` does not exist")
 
         input_file = str(Path(input_file).resolve())
-        pdf_loader = pypdf.PdfReader(input_file)
+
+        return input_file, pypdf.PdfReader(input_file)
+
+    def load_data(self, input_file: str) -> List[Document]:
+        """
+        Loads data from the specified file.
+
+        Args:
+            input_file (str): File path to load.
+
+        Returns:
+            List[Document]: A list of `Document` objects loaded from the file.
+        """
+        input_file, pdf_loader = self._open_pdf(input_file)
+
+        num_pages = len(pdf_loader.pages)
+        max_workers = self.max_workers
+
+        # Processes are opt-in, nested in the callers' thread pools they oversubscribe the CPUs
+        if not max_workers or max_workers == 1 or num_pages < _PARALLEL_PAGES_THRESHOLD:
+            return list(self._iter_documents(input_file, pdf_loader))
+
+        # `extract_text` is CPU bound pure Python, split the pages across processes
+        step = math.ceil(num_pages / max_workers)
+        page_ranges = [
+            (input_file, start, min(start + step, num_pages))
+            for start in range(0, num_pages, step)
+        ]
+
+        # `spawn` never forks the (possibly multithreaded) calling process
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            texts = [
+                text
+                for range_texts in executor.map(_extract_pages_text, page_ranges)
+                for text in range_texts
+            ]
 
         return [
             Document(
-                text=page.extract_text().strip(),
+                text=text,
                 metadata={"source": input_file, "page": page_number},
             )
-            for page_number, page in enumerate(pdf_loader.pages)
+            for page_number, text in enumerate(texts)
         ]
+
+    def iter_pages(self, input_file: str) -> Iterator[Document]:
+        """
+        Lazily loads the specified file, one `Document` per page.
+
+        Only the current page text is held in memory, which suits streaming large PDFs.
+
+        Args:
+            input_file (str): File path to load.
+
+        Returns:
+            Iterator[Document]: An iterator of `Document` objects, one per page.
+        """
+        input_file, pdf_loader = self._open_pdf(input_file)
+
+        return self._iter_documents(input_file, pdf_loader)
+
+    @staticmethod
+    def _iter_documents(input_file: str, pdf_loader) -> Iterator[Document]:
+        for page_number, page in enumerate(pdf_loader.pages):
+            yield Document(
+                text=page.extract_text().strip(),
+                metadata={"source": input_file, "page": page_number},
+            )
@@ -2,10 +2,12 @@ import os
 
 # import re
 import tempfile
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader, DirectoryReader
+from pydantic.v1 import PrivateAttr
 
 
 class IBMCOSReader(BaseReader):
@@ -17,6 +19,7 @@ class IBMCOSReader(BaseReader):
         ibm_api_key_id (str): IBM Cloud API key.
         ibm_service_instance_id (str): Service instance ID for the IBM COS.
         s3_endpoint_url (str): Endpoint for the IBM Cloud Object Storage service (S3 compatible).
+        max_workers (int, optional): Maximum number of concurrent download requests. Defaults to `32`.
 
     Example:
         .. code-block:: python
@@ -31,42 +34,112 @@ class IBMCOSReader(BaseReader):
             )
     """
 
+    bucket: str
+    ibm_api_key_id: Optional[str] = None
+    ibm_service_instance_id: Optional[str] = None
+    s3_endpoint_url: Optional[str] = None
+    max_workers: int = 32
+
+    _ibm_boto3: Any = PrivateAttr()
+    _boto_config: Any = PrivateAttr()
+
     def __init__(
         self,
         bucket: str,
         ibm_api_key_id: str = None,
         ibm_service_instance_id: str = None,
         s3_endpoint_url: str = None,
+        max_workers: int = 32,
     ):
         import ibm_boto3
         from ibm_botocore.client import Config
 
+        super().__init__(
+            bucket=bucket,
+            ibm_api_key_id=ibm_api_key_id,
+            ibm_service_instance_id=ibm_service_instance_id,
+            s3_endpoint_url=s3_endpoint_url,
+            max_workers=max_workers,
+        )
+
         self._ibm_boto3 = ibm_boto3
         self._boto_config = Config
 
-        self.bucket = bucket
-        self.ibm_api_key_id = ibm_api_key_id
-        self.ibm_service_instance_id = ibm_service_instance_id
-        self.s3_endpoint_url = s3_endpoint_url
-
     def load_data(self) -> List[Document]:
         """Loads data from the specified bucket."""
+        from ibm_boto3.s3.transfer import TransferConfig, create_transfer_manager
+
         ibm_s3 = self._ibm_boto3.resource(
             "s3",
             ibm_api_key_id=self.ibm_api_key_id,
             ibm_service_instance_id=self.ibm_service_instance_id,
-            config=self._boto_config(signature_version="oauth"),
+            # Size the connection pool for the concurrent downloads, botocore defaults to 10
+            config=self._boto_config(
+                signature_version="oauth",
+                max_pool_connections=max(self.max_workers, 10),
+            ),
             endpoint_url=self.s3_endpoint_url,
         )
 
-        bucket = ibm_s3.Bucket(self.bucket)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for obj in bucket.objects.filter(Prefix=""):
-                file_path = f"{temp_dir}/{obj.key}"
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                ibm_s3.meta.client.download_file(self.bucket, obj.key, file_path)
+        # Low-level clients are thread-safe, a single one is shared by all transfers
+        s3_client = ibm_s3.meta.client
+        paginator = s3_client.get_paginator("list_objects_v2")
+
+        directory_reader = DirectoryReader()
+        required_exts = tuple(ext.lower() for ext in directory_reader.required_exts)
+
+        def _load_file(file_path: str) -> List[Document]:
+            documents = directory_reader.load_file(file_path)
+            # Parsed files are dropped right away, the temp dir never holds the whole bucket
+            os.remove(file_path)
+            return documents
+
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            ThreadPoolExecutor(max_workers=self.max_workers) as parse_executor,
+        ):
+            # One transfer manager for every object: its worker pool is shared across
+            # files and large objects are fetched in concurrent multipart ranges
+            with create_transfer_manager(
+                s3_client,
+                TransferConfig(max_concurrency=self.max_workers),
+            ) as transfer_manager:
+                downloads = []
+
+                # Downloads start as soon as each listing page arrives, overlapping
+                # the remaining list requests
+                for page in paginator.paginate(Bucket=self.bucket):
+                    for obj in page.get("Contents", []):
+                        key = obj["Key"]
+                        # Only fetch objects a reader is registered for, this also
+                        # skips "folder" placeholder keys
+                        if not key.lower().endswith(required_exts):
+                            continue
+
+                        # Hidden objects and "folders" are skipped, as `DirectoryReader` does
+                        if any(part.startswith(".") for part in key.split("/")):
+                            continue
+
+                        file_path = f"{temp_dir}/{key}"
+                        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                        downloads.append(
+                            (
+                                file_path,
+                                transfer_manager.download(self.bucket, key, file_path),
+                            ),
+                        )
+
+                # Each file is parsed as soon as it is downloaded, while the
+                # remaining transfers are still in flight
+                parse_futures = []
+                for file_path, transfer_future in downloads:
+                    transfer_future.result()
+                    parse_futures.append(parse_executor.submit(_load_file, file_path))
 
             # s3_source = re.sub(r"^(https?)://", "", self.s3_endpoint_url)
 
-            return DirectoryReader(input_dir=temp_dir).load_data()
+            documents = []
+            for parse_future in parse_futures:
+                documents.extend(parse_future.result())
+
+            return documents
@@ -1,9 +1,13 @@
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import reduce
 from logging import getLogger
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pineflow.core.document import Document
 from pineflow.core.readers import BaseReader
+from pydantic.v1 import PrivateAttr
 
 logger = getLogger(__name__)
 
@@ -21,6 +25,7 @@ class WatsonDiscoveryReader(BaseReader):
         project_id (str): Watson Discovery project ID.
         version (str, optional): Watson Discovery API version. Defaults to `2023-03-31`.
         batch_size (int, optional): Batch size for bulk operations. Defaults to `50`.
+        max_workers (int, optional): Maximum number of pages fetched concurrently. Defaults to `8`.
         created_date (str, optional): Load documents created after this date.
             Expected format is `YYYY-MM-DD`. Defaults to today's date.
         pre_additional_data_field (str, optional): Additional data field to prepend to the Document content.
@@ -36,6 +41,15 @@ class WatsonDiscoveryReader(BaseReader):
             )
     """
 
+    project_id: str
+    batch_size: int = 50
+    max_workers: int = 8
+    created_date: str
+    pre_additional_data_field: Optional[str] = None
+
+    _client: Any = PrivateAttr()
+    _pre_additional_data_keys: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+
     def __init__(
         self,
         url: str,
@@ -43,16 +57,24 @@ class WatsonDiscoveryReader(BaseReader):
         project_id: str,
         version: str = "2023-03-31",
         batch_size: int = 50,
+        max_workers: int = 8,
         created_date: str = datetime.today().strftime("%Y-%m-%d"),
         pre_additional_data_field: str = None,
     ) -> None:
         from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
         from ibm_watson import DiscoveryV2
 
-        self.project_id = project_id
-        self.batch_size = batch_size
-        self.created_date = created_date
-        self.pre_additional_data_field = pre_additional_data_field
+        super().__init__(
+            project_id=project_id,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            created_date=created_date,
+            pre_additional_data_field=pre_additional_data_field,
+        )
+
+        # The key path is the same for every document, split it once
+        if pre_additional_data_field:
+            self._pre_additional_data_keys = tuple(pre_additional_data_field.split("."))
 
         try:
             authenticator = IAMAuthenticator(api_key)
@@ -74,9 +96,7 @@ class WatsonDiscoveryReader(BaseReader):
         """
         from ibm_watson.discovery_v2 import QueryLargePassages
 
-        last_batch_size = self.batch_size
-        offset_len = 0
-        documents = []
+        # Query parameters are the same for every page, build them once
         return_fields = [
             "extracted_metadata.filename",
             "extracted_metadata.file_type",
@@ -86,54 +106,69 @@ class WatsonDiscoveryReader(BaseReader):
         if self.pre_additional_data_field:
             return_fields.append(self.pre_additional_data_field)
 
-        while last_batch_size == self.batch_size:
-            results = self._client.query(
+        query_filter = f"extracted_metadata.publicationdate>={self.created_date}"
+        passages = QueryLargePassages(enabled=False)
+
+        def _query_page(offset: int) -> Dict:
+            return self._client.query(
                 project_id=self.project_id,
                 count=self.batch_size,
-                offset=offset_len,
+                offset=offset,
                 return_=return_fields,
-                filter="extracted_metadata.publicationdate>={}".format(
-                    self.created_date,
-                ),
-                passages=QueryLargePassages(enabled=False),
+                filter=query_filter,
+                passages=passages,
             ).get_result()
 
-            last_batch_size = len(results["results"])
-            offset_len = offset_len + last_batch_size
-
-            # Make sure all retrieved document 'text' exist
-            results_documents = [doc for doc in results["results"] if "text" in doc]
-
-            if self.pre_additional_data_field:
-                for i, doc in enumerate(results_documents):
-                    doc["text"].insert(
-                        0,
-                        self._get_nested_value(doc, self.pre_additional_data_field),
-                    )
-
-            documents.extend(
-                [
-                    Document(
-                        id_=doc["document_id"],
-                        text="\n".join(doc["text"]),
-                        metadata={
-                            "collection_id": doc["result_metadata"]["collection_id"],
-                        }
-                        | doc["extracted_metadata"],
-                    )
-                    for doc in results_documents
-                ],
+        first_page = _query_page(0)
+        pages = [first_page["results"]]
+
+        # The first page reveals the total, the remaining pages are fetched concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pages.extend(
+                executor.map(
+                    lambda offset: _query_page(offset)["results"],
+                    range(
+                        self.batch_size,
+                        first_page["matching_results"],
+                        self.batch_size,
+                    ),
+                ),
             )
 
-        return documents
+        # Keep paging if documents were added after the first page
+        while len(pages[-1]) == self.batch_size:
+            pages.append(_query_page(len(pages) * self.batch_size)["results"])
 
-    @staticmethod
-    def _get_nested_value(d, key_path, separator: Optional[str] = "."):
-        """Accesses a nested value in a dictionary using a string key path."""
-        keys = key_path.split(separator)  # Split the key_path using the separator
-        nested_value = d
+        documents = []
+        for page in pages:
+            documents.extend(self._to_documents(page))
 
-        for key in keys:
-            nested_value = nested_value[key]  # Traverse the dictionary by each key
+        return documents
 
-        return nested_value
+    def _to_documents(self, results: List[Dict]) -> List[Document]:
+        # Make sure all retrieved document 'text' exist
+        results_documents = [doc for doc in results if "text" in doc]
+
+        if self._pre_additional_data_keys:
+            for doc in results_documents:
+                doc["text"].insert(
+                    0,
+                    self._get_nested_value(doc, self._pre_additional_data_keys),
+                )
+
+        return [
+            Document(
+                id_=doc["document_id"],
+                text="\n".join(doc["text"]),
+                metadata={
+                    "collection_id": doc["result_metadata"]["collection_id"],
+                }
+                | doc["extracted_metadata"],
+            )
+            for doc in results_documents
+        ]
+
+    @staticmethod
+    def _get_nested_value(d: Dict, keys: Tuple[str, ...]):
+        """Accesses a nested value in a dictionary using a pre-split key path."""
+        return reduce(operator.getitem, keys, d)
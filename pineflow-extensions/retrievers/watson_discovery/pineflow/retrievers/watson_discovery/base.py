@@ -44,6 +44,11 @@ class WatsonDiscoveryRetriever:
 
         self.disable_passages = disable_passages
         self.project_id = project_id
+        self._return_fields = [
+            "extracted_metadata.filename",
+            "extracted_metadata.file_type",
+            "text" if disable_passages else "passages",
+        ]
 
         try:
             authenticator = IAMAuthenticator(api_key)
@@ -76,18 +81,11 @@ class WatsonDiscoveryRetriever:
         """
         from ibm_watson.discovery_v2 import QueryLargePassages
 
-        return_fields = ["extracted_metadata.filename", "extracted_metadata.file_type"]
-
-        if not self.disable_passages:
-            return_fields.append("passages")
-        else:
-            return_fields.append("text")
-
         discovery_results = self._client.query(
             project_id=self.project_id,
             natural_language_query=query,
             count=top_k,
-            return_=return_fields,
+            return_=self._return_fields,
             filter=filter,
             passages=QueryLargePassages(
                 enabled=not self.disable_passages,
@@ -102,20 +100,19 @@ class WatsonDiscoveryRetriever:
 
         if not self.disable_passages and len(discovery_results["passages"]) > 0:
             # If not `disable_passages`, always use discovery passages (recommended)
+            results_by_id = {
+                doc["document_id"]: doc for doc in discovery_results["results"]
+            }
+
             for passage in discovery_results["passages"]:
-                document_id_target = passage["document_id"]
-                document = [
-                    doc
-                    for doc in discovery_results["results"]
-                    if doc["document_id"] == document_id_target
-                ]
+                document = results_by_id[passage["document_id"]]
 
                 docs_and_scores.append(
                     DocumentWithScore(
                         document=Document(
                             text=passage["passage_text"],
                             metadata={"collection_id": passage["collection_id"]}
-                            | document[0]["extracted_metadata"],
+                            | document["extracted_metadata"],
                         ),
                         score=passage["passage_score"] / 100,
                     ),
@@ -1,7 +1,9 @@
 import uuid
+from functools import lru_cache
 from logging import getLogger
 from typing import List, Literal
 
+import numpy as np
 from pineflow.core.document import Document, DocumentWithScore
 from pineflow.core.embeddings import BaseEmbedding
 from pineflow.core.vector_stores import BaseVectorStore
@@ -9,6 +11,15 @@ from pineflow.core.vector_stores import BaseVectorStore
 logger = getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_chroma_client():
+    import chromadb
+    import chromadb.config
+
+    # Settings parsing and client start-up are paid once per process
+    return chromadb.Client(chromadb.config.Settings())
+
+
 class ChromaVectorStore(BaseVectorStore):
     """
     Chroma is the AI-native open-source vector database.
@@ -36,12 +47,8 @@ class ChromaVectorStore(BaseVectorStore):
         collection_name: str = None,
         distance_strategy: Literal["cosine", "ip", "l2"] = "cosine",
     ) -> None:
-        import chromadb
-        import chromadb.config
-
         self._embed_model = embed_model
-        self._client_settings = chromadb.config.Settings()
-        self._client = chromadb.Client(self._client_settings)
+        self._client = _get_chroma_client()
 
         if collection_name is None:
             collection_name = "auto-generated-" + str(uuid.uuid4())[:8]
@@ -60,21 +67,27 @@ class ChromaVectorStore(BaseVectorStore):
         Args:
             documents (List[Document]): List of documents to add to the collection.
         """
-        embeddings = []
-        metadatas = []
-        ids = []
-        chroma_documents = []
-
-        for doc in documents:
-            metadatas.append({**doc.get_metadata(), "hash": doc.hash})
-
-            embeddings.append(
-                doc.embedding
-                if doc.embedding
-                else self._embed_model.get_text_embedding(doc.get_content()),
+        chroma_documents = [doc.get_content() for doc in documents]
+        embeddings = [doc.embedding for doc in documents]
+
+        # Embed every document missing a vector in a single batched call
+        missing = [
+            i
+            for i, embedding in enumerate(embeddings)
+            if embedding is None or len(embedding) == 0
+        ]
+        if missing:
+            missing_embeddings = self._embed_model.get_texts_embedding(
+                [chroma_documents[i] for i in missing],
             )
-            ids.append(doc.id_ if doc.id_ else str(uuid.uuid4()))
-            chroma_documents.append(doc.get_content())
+            for i, embedding in zip(missing, missing_embeddings):
+                embeddings[i] = embedding
+
+        # Chroma takes the float32 matrix directly, no per-document list conversion
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        metadatas = [{**doc.get_metadata(), "hash": doc.hash} for doc in documents]
+        ids = [doc.id_ if doc.id_ else str(uuid.uuid4()) for doc in documents]
 
         self._collection.add(
             embeddings=embeddings,
@@ -130,21 +143,19 @@ class ChromaVectorStore(BaseVectorStore):
         default_fields = ["documents", "metadatas", "embeddings"]
         include = include_fields if include_fields else default_fields
         field_map = {
-            "ids": "_id",
+            "ids": "id_",
             "documents": "text",
             "metadatas": "metadata",
             "embeddings": "embedding",
         }
 
         data = self._collection.get(include=include)
-        num_items = len(data["ids"])
+
+        # Field names are resolved once, each row is unpacked positionally
+        mapped_keys = [field_map[key] for key in ("ids", *include)]
+        columns = [data[key] for key in include]
 
         return [
-            Document(
-                **{
-                    mapped_key: data[original_key][i]
-                    for original_key, mapped_key in field_map.items()
-                },
-            )
-            for i in range(num_items)
+            Document(**dict(zip(mapped_keys, row)))
+            for row in zip(data["ids"], *columns)
         ]
@@ -1,7 +1,8 @@
 import uuid
 from logging import getLogger
-from typing import List, Literal
+from typing import Iterator, List, Literal, Optional
 
+import numpy as np
 from pineflow.core.document import Document, DocumentWithScore
 from pineflow.core.embeddings import BaseEmbedding
 from pineflow.core.vector_stores.base import BaseVectorStore
@@ -26,6 +27,10 @@ class ElasticsearchVectorStore(BaseVectorStore):
         text_field (str, optional): Name of the field containing text. Defaults to `text`.
         vector_field (str, optional): Name of the field containing vector embeddings. Defaults to `embedding`.
 
+    Note:
+        Requests are serialized with `orjson` when it is installed, which is considerably
+        faster for payloads dominated by embedding vectors.
+
     Example:
         .. code-block:: python
 
@@ -53,10 +58,11 @@ class ElasticsearchVectorStore(BaseVectorStore):
         text_field: str = "text",
         vector_field: str = "embedding",
     ) -> None:
-        from elasticsearch import Elasticsearch
+        from elasticsearch import Elasticsearch, NotFoundError, OrjsonSerializer
         from elasticsearch.helpers import bulk
 
         self._es_bulk = bulk
+        self._es_not_found_error = NotFoundError
 
         #  TO-DO: Add connections types e.g: cloud
         self._embed_model = embed_model
@@ -71,6 +77,8 @@ class ElasticsearchVectorStore(BaseVectorStore):
             basic_auth=(user, password),
             verify_certs=ssl,
             ssl_show_warn=False,
+            # `OrjsonSerializer` is `None` when `orjson` is not installed
+            serializer=OrjsonSerializer() if OrjsonSerializer else None,
         )
 
         try:
@@ -112,13 +120,6 @@ class ElasticsearchVectorStore(BaseVectorStore):
 
             self._client.indices.create(index=self.index_name, mappings=index_mappings)
 
-    def _dynamic_metadata_mapping(self, metadata) -> dict:
-        """Dynamic maps metadata object into keyword fields."""
-        metadata_mapping = {}
-        for key, value in metadata.items():
-            metadata_mapping[f"metadata.{key}"] = value
-        return metadata_mapping
-
     def add_documents(
         self,
         documents: List[Document],
@@ -135,31 +136,44 @@ class ElasticsearchVectorStore(BaseVectorStore):
         if create_index_if_not_exists:
             self._create_index_if_not_exists()
 
-        vector_store_data = []
-        for doc in documents:
-            _id = doc.id_ if doc.id_ else str(uuid.uuid4())
-            _metadata = {**doc.get_metadata(), "hash": doc.hash}
-            _metadata_mapping = self._dynamic_metadata_mapping(_metadata)
-            vector_store_data.append(
-                {
+        embeddings = [doc.embedding for doc in documents]
+
+        # Embed every document missing a vector in a single batched call
+        missing = [
+            i
+            for i, embedding in enumerate(embeddings)
+            if embedding is None or len(embedding) == 0
+        ]
+        if missing:
+            missing_embeddings = self._embed_model.get_texts_embedding(
+                [documents[i].get_content() for i in missing],
+            )
+            for i, embedding in zip(missing, missing_embeddings):
+                embeddings[i] = embedding
+
+        # A single float32 matrix, its rows are serialized as-is without a
+        # per-document list conversion (`dense_vector` is stored as float32)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        def _bulk_actions():
+            # Actions are generated lazily, `bulk` serializes them chunk by chunk
+            for doc, embedding in zip(documents, embeddings):
+                yield {
                     "_index": self.index_name,
-                    "_id": _id,
+                    "_id": doc.id_ if doc.id_ else str(uuid.uuid4()),
                     self.text_field: doc.get_content(),
-                    self.vector_field: doc.embedding
-                    if doc.embedding
-                    else self._embed_model.get_text_embedding(doc.get_content()),
-                    "metadata": _metadata,
-                    **_metadata_mapping,
-                },
-            )
+                    self.vector_field: embedding,
+                    # `metadata.*` keys are mapped as keywords by the index template
+                    "metadata": {**doc.get_metadata(), "hash": doc.hash},
+                }
 
         self._es_bulk(
             self._client,
-            vector_store_data,
+            _bulk_actions(),
             chunk_size=self.batch_size,
             refresh=True,
         )
-        print(f"Added {len(vector_store_data)} documents to `{self.index_name}`")
+        print(f"Added {len(documents)} documents to `{self.index_name}`")
 
         return [doc.id_ for doc in documents]
 
@@ -186,8 +200,6 @@ class ElasticsearchVectorStore(BaseVectorStore):
             },
         }
 
-        from elasticsearch import NotFoundError
-
         try:
             data = self._client.search(
                 index=self.index_name,
@@ -195,7 +207,7 @@ class ElasticsearchVectorStore(BaseVectorStore):
                 size=top_k,
                 _source={"excludes": [self.vector_field]},
             )
-        except NotFoundError as e:
+        except self._es_not_found_error as e:
             if e.status_code == 404 and e.error == "index_not_found_exception":
                 return []
             else:
@@ -222,60 +234,75 @@ class ElasticsearchVectorStore(BaseVectorStore):
         Args:
             ids (List[str]): List of documents IDs to delete.
         """
-        for id in ids:
-            self._client.delete(index=self.index_name, id=id)
+        # One `_bulk` request per chunk instead of a DELETE round trip per ID
+        self._es_bulk(
+            self._client,
+            (
+                {"_op_type": "delete", "_index": self.index_name, "_id": _id}
+                for _id in ids
+            ),
+            chunk_size=self.batch_size,
+            refresh=True,
+        )
 
     def get_all_documents(self, include_fields: List[str] = []) -> List[Document]:
         """Get all documents from vector store."""
-        es_query = {"query": {"match_all": {}}}
+        return list(self.iter_all_documents(include_fields=include_fields))
 
-        if len(include_fields):
-            es_query["_source"] = include_fields
+    def iter_all_documents(
+        self,
+        include_fields: Optional[List[str]] = None,
+    ) -> Iterator[Document]:
+        """
+        Lazily iterates over all documents in the vector store.
 
-        from elasticsearch import NotFoundError
+        Documents are built one hit at a time while paging through the index,
+        which suits indices too large to hold in memory.
 
+        Args:
+            include_fields (List[str], optional): Source fields to retrieve. Defaults to `None` (all fields).
+        """
+        # A point in time with `search_after` replaces the deprecated scroll API
         try:
-            data = self._client.search(
+            pit_id = self._client.open_point_in_time(
                 index=self.index_name,
-                scroll="2m",
-                size=1000,
-                body=es_query,
-            )
-        except NotFoundError as e:
+                keep_alive="2m",
+            )["id"]
+        except self._es_not_found_error as e:
             if e.status_code == 404 and e.error == "index_not_found_exception":
-                return []
+                return
             else:
                 raise
 
-        scroll_id = data["_scroll_id"]
-        hits = data.get("hits", {}).get("hits", [])
-
-        documents = [
-            Document(
-                id_=hit["_id"],
-                metadata=hit["_source"].get("metadata", {}),
-                embedding=hit["_source"].get(self.vector_field),
-                text=hit["_source"].get(self.text_field, ""),
-            )
-            for hit in hits
-        ]
-
-        while len(hits) > 0:
-            scroll_data = self._client.scroll(scroll_id=scroll_id, scroll="2m")
-            scroll_id = scroll_data["_scroll_id"]
+        es_query = {
+            "query": {"match_all": {}},
+            "pit": {"id": pit_id, "keep_alive": "2m"},
+            # `_shard_doc` is the cheapest tiebreaker sort for a point in time
+            "sort": [{"_shard_doc": "asc"}],
+        }
 
-            hits = scroll_data.get("hits", {}).get("hits", [])
+        if include_fields:
+            es_query["_source"] = include_fields
 
-            documents.extend(
-                [
-                    Document(
+        try:
+            while True:
+                data = self._client.search(size=1000, body=es_query)
+                # The point in time id may change between requests
+                es_query["pit"]["id"] = data.get("pit_id", es_query["pit"]["id"])
+                hits = data.get("hits", {}).get("hits", [])
+
+                for hit in hits:
+                    source = hit["_source"]
+                    yield Document(
                         id_=hit["_id"],
-                        metadata=hit["_source"].get("metadata", {}),
-                        embedding=hit["_source"].get(self.vector_field),
-                        text=hit["_source"].get(self.text_field, ""),
+                        metadata=source.get("metadata", {}),
+                        embedding=source.get(self.vector_field),
+                        text=source.get(self.text_field, ""),
                     )
-                    for hit in hits
-                ],
-            )
 
-        return documents
+                if len(hits) < 1000:
+                    break
+
+                es_query["search_after"] = hits[-1]["sort"]
+        finally:
+            self._client.close_point_in_time(body={"id": es_query["pit"]["id"]})